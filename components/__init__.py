@@ -2,14 +2,27 @@
 UI Components for EU Parts Job Dashboard.
 """
 
+import importlib
+
 from components.job_card import (
     render_job_card,
     render_job_list,
     render_job_summary,
     render_job_metrics
 )
-from components.bulk_lookup import render_bulk_lookup
-from components.parts_inventory import render_parts_inventory
+
+# Page components are imported on first access, so importing the package
+# for the job cards doesn't load every page module at app start
+_LAZY_EXPORTS = {
+    'render_bulk_lookup': 'components.bulk_lookup',
+    'render_parts_inventory': 'components.parts_inventory',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'render_job_card',
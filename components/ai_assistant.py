@@ -5,7 +5,7 @@ Provides natural language search and intelligent assistance.
 
 import streamlit as st
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Union
 
 from config.settings import AppSettings, FeatureFlags
 
@@ -37,7 +37,7 @@ def get_ai_client():
 def render_ai_search_bar(
     available_statuses: List[str],
     available_priorities: List[str],
-    available_customers: List[str] = None,
+    available_customers: Union[List[str], Callable[[], List[str]]] = None,
     key_prefix: str = "ai_search"
 ) -> Optional[Dict[str, Any]]:
     """
@@ -46,7 +46,8 @@ def render_ai_search_bar(
     Args:
         available_statuses: List of valid job statuses
         available_priorities: List of valid priority levels
-        available_customers: List of customer names
+        available_customers: List of customer names, or a callable
+            returning one; a callable is only invoked when a search runs
         key_prefix: Unique key prefix for Streamlit widgets
 
     Returns:
@@ -81,6 +82,8 @@ def render_ai_search_bar(
         with st.spinner("Understanding your search..."):
             client = get_ai_client()
             if client:
+                if callable(available_customers):
+                    available_customers = available_customers()
                 result = client.parse_natural_language_search(
                     query=query,
                     available_statuses=available_statuses,
@@ -251,14 +254,15 @@ def render_parts_extraction(description: str, key_prefix: str = "parts_extract")
 
 
 def render_summary_generator(
-    jobs_data: List[Dict],
+    jobs_data: Union[List[Dict], Callable[[], List[Dict]]],
     key_prefix: str = "summary"
 ):
     """
     Render a summary report generator.
 
     Args:
-        jobs_data: List of job dictionaries
+        jobs_data: List of job dictionaries, or a callable returning one;
+            a callable is only invoked when a summary is generated
         key_prefix: Unique key prefix for Streamlit widgets
     """
     if not is_ai_available():
@@ -287,6 +291,8 @@ def render_summary_generator(
         with st.spinner("Generating summary..."):
             client = get_ai_client()
             if client:
+                if callable(jobs_data):
+                    jobs_data = jobs_data()
                 result = client.generate_summary(
                     jobs_data=jobs_data,
                     summary_type=summary_type
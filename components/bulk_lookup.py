@@ -9,7 +9,8 @@ from typing import List
 
 from database.queries import JobQueries
 from components.job_card import render_job_summary, render_job_card
-from utils.formatters import format_datetime, format_status
+from utils.export import df_to_csv, df_to_json
+from utils.formatters import format_datetime_column, format_status_column
 from utils.language import Language
 
 
@@ -26,15 +27,19 @@ def render_bulk_lookup(lang: Language):
     Search for multiple jobs at once by entering job numbers (one per line).
     """)
 
-    # Text area for entering job numbers
-    job_numbers_text = st.text_area(
-        lang.get("enter_job_numbers"),
-        height=200,
-        placeholder="JOB-001\nJOB-002\nJOB-003"
-    )
+    # Text area for entering job numbers; in a form, editing the list
+    # doesn't rerun the page until the search is submitted
+    with st.form("bulk_lookup_form", border=False):
+        job_numbers_text = st.text_area(
+            lang.get("enter_job_numbers"),
+            height=200,
+            placeholder="JOB-001\nJOB-002\nJOB-003"
+        )
+
+        # Search button
+        submitted = st.form_submit_button(lang.get("search"), type="primary")
 
-    # Search button
-    if st.button(lang.get("search"), type="primary"):
+    if submitted:
         if job_numbers_text.strip():
             # Parse job numbers
             job_numbers = [
@@ -122,17 +127,11 @@ def render_results_table(jobs_df: pd.DataFrame, lang: Language):
         'job_address'
     ]
 
-    # Create display dataframe
-    display_df = jobs_df[display_columns].copy()
-
-    # Format datetime columns
-    display_df['scheduled_start_time'] = display_df['scheduled_start_time'].apply(
-        lambda x: format_datetime(x) if pd.notna(x) else 'N/A'
-    )
-
-    # Format status
-    display_df['job_status'] = display_df['job_status'].apply(
-        lambda x: format_status(x) if pd.notna(x) else 'Unknown'
+    # Create display dataframe; dates are formatted here so missing ones
+    # read "N/A" rather than a blank cell
+    display_df = jobs_df[display_columns].assign(
+        scheduled_start_time=format_datetime_column(jobs_df['scheduled_start_time']),
+        job_status=format_status_column(jobs_df['job_status']),
     )
 
     # Rename columns for display
@@ -179,22 +178,21 @@ def render_export_options(jobs_df: pd.DataFrame, lang: Language):
 
     col1, col2 = st.columns(2)
 
+    # Payloads are generated when a button is clicked, not on every rerun
     with col1:
         # Export as CSV
-        csv = jobs_df.to_csv(index=False)
         st.download_button(
             label="Download as CSV",
-            data=csv,
+            data=lambda: df_to_csv(jobs_df),
             file_name="eu_parts_jobs.csv",
             mime="text/csv"
         )
 
     with col2:
         # Export as JSON
-        json_str = jobs_df.to_json(orient='records', date_format='iso', indent=2)
         st.download_button(
             label="Download as JSON",
-            data=json_str,
+            data=lambda: df_to_json(jobs_df),
             file_name="eu_parts_jobs.json",
             mime="application/json"
         )
@@ -9,6 +9,7 @@ import pandas as pd
 
 from utils.formatters import (
     format_datetime,
+    format_datetime_column,
     format_status,
     format_priority,
     format_coordinates,
@@ -19,6 +20,19 @@ from utils.formatters import (
 from utils.gps_helpers import validate_coordinates
 
 
+# Status icon mapping for the compact job list
+_STATUS_ICONS = {
+    'New Ticket': '🆕',
+    'Received Request': '📥',
+    'Parts On Order': '🛒',
+    'Shop Pick UP': '🏪',
+    'Shipped': '📦',
+    'Parts delivered': '✅',
+    'Done': '🎉',
+    'Canceled': '⊘'
+}
+
+
 def render_job_card(job: Dict[str, Any], show_details: bool = True):
     """
     Render a job card with job information.
@@ -158,13 +172,14 @@ def render_job_card(job: Dict[str, Any], show_details: bool = True):
             st.link_button("View in Zuper", zuper_url, type="primary")
 
 
-def render_job_list(jobs_df: pd.DataFrame, max_items: int = 10):
+def render_job_list(jobs_df: pd.DataFrame, max_items: int = 10, total: Optional[int] = None):
     """
     Render a list of jobs as compact cards.
 
     Args:
         jobs_df: DataFrame with job data
         max_items: Maximum number of items to display
+        total: Total matching jobs when jobs_df is one page of them (default: len(jobs_df))
     """
     if jobs_df.empty:
         st.info("No jobs to display")
@@ -172,30 +187,24 @@ def render_job_list(jobs_df: pd.DataFrame, max_items: int = 10):
 
     # Header with count
     showing = min(len(jobs_df), max_items)
-    total = len(jobs_df)
+    total = len(jobs_df) if total is None else total
     st.caption(f"📋 Showing {showing} of {total} jobs")
 
+    # Format the visible page in one vectorized pass, then read plain
+    # dicts with missing values as None rather than a Series per row
+    page_df = jobs_df.head(max_items)
+    scheduled_labels = format_datetime_column(page_df['scheduled_start_time']).tolist()
+    jobs = page_df.astype(object).where(page_df.notna(), None).to_dict('records')
+
     # Display jobs in a cleaner card format
-    for idx, (_, job) in enumerate(jobs_df.head(max_items).iterrows()):
-        job_number = job.get('job_number', 'N/A')
-        status = job.get('job_status', 'Unknown')
+    for job, scheduled in zip(jobs, scheduled_labels):
+        job_number = job.get('job_number') or 'N/A'
+        status = job.get('job_status') or 'Unknown'
         asset = job.get('asset_name') or 'N/A'
-        title = job.get('title', '')
-        scheduled = format_datetime(job.get('scheduled_start_time'))
+        title = job.get('title') or ''
         job_uid = job.get('job_uid')
 
-        # Status icon mapping
-        status_icons = {
-            'New Ticket': '🆕',
-            'Received Request': '📥',
-            'Parts On Order': '🛒',
-            'Shop Pick UP': '🏪',
-            'Shipped': '📦',
-            'Parts delivered': '✅',
-            'Done': '🎉',
-            'Canceled': '⊘'
-        }
-        icon = status_icons.get(status, '📋')
+        icon = _STATUS_ICONS.get(status, '📋')
 
         # Card layout
         with st.container():
@@ -5,10 +5,13 @@ Displays parts-related information and statistics.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from typing import Dict, Any
 
+from config.settings import AppSettings
 from database.queries import JobQueries
-from utils.formatters import format_datetime, format_status, status_badge
+from utils.formatters import format_datetime, format_datetime_column, format_status, status_badge
+from utils.export import df_to_csv
 from utils.language import Language
 
 
@@ -27,7 +30,7 @@ def render_parts_inventory(lang: Language):
 
     # Load data
     with st.spinner(lang.get("loading")):
-        jobs_df = JobQueries.get_all_eu_parts_jobs()
+        jobs_df = load_parts_jobs()
 
         if jobs_df.empty:
             st.warning(lang.get("no_jobs_found"))
@@ -52,6 +55,19 @@ def render_parts_inventory(lang: Language):
         render_jobs_waiting_for_parts(jobs_df, lang)
 
 
+@st.cache_data(ttl=AppSettings.CACHE_TTL_SHORT, show_spinner=False)
+def load_parts_jobs() -> pd.DataFrame:
+    """
+    Load all EU parts jobs for the inventory page, cached across reruns.
+    The status and priority selectboxes rerun the page on every change,
+    so without the cache each one re-queried the database.
+
+    Returns:
+        DataFrame with all EU parts jobs
+    """
+    return JobQueries.get_eu_parts_jobs_for_dashboard()
+
+
 def render_parts_metrics(jobs_df: pd.DataFrame, lang: Language):
     """
     Render parts-related metrics.
@@ -129,7 +145,7 @@ def render_parts_delivery_timeline(jobs_df: pd.DataFrame, lang: Language):
     st.subheader("Parts Delivery Timeline")
 
     # Filter jobs with delivered parts
-    delivered_jobs = jobs_df[jobs_df['parts_delivered_date'].notna()].copy()
+    delivered_jobs = jobs_df[jobs_df['parts_delivered_date'].notna()]
 
     if delivered_jobs.empty:
         st.info("No parts delivery data available")
@@ -161,10 +177,14 @@ def render_parts_delivery_timeline(jobs_df: pd.DataFrame, lang: Language):
             st.markdown(status_badge(format_status(status)), unsafe_allow_html=True)
 
 
+@st.fragment
 def render_jobs_waiting_for_parts(jobs_df: pd.DataFrame, lang: Language):
     """
     Render list of jobs waiting for parts.
 
+    Runs as a fragment: changing the status or priority filter reruns
+    only this list, not the metrics, chart and timeline above it.
+
     Args:
         jobs_df: DataFrame with job data
         lang: Language instance for translations
@@ -172,7 +192,7 @@ def render_jobs_waiting_for_parts(jobs_df: pd.DataFrame, lang: Language):
     st.subheader("Jobs Waiting for Parts")
 
     # Filter jobs without parts delivered
-    waiting_jobs = jobs_df[jobs_df['parts_delivered_date'].isna()].copy()
+    waiting_jobs = jobs_df[jobs_df['parts_delivered_date'].isna()]
 
     if waiting_jobs.empty:
         st.success("No jobs waiting for parts!")
@@ -202,14 +222,16 @@ def render_jobs_waiting_for_parts(jobs_df: pd.DataFrame, lang: Language):
             all_priorities
         )
 
-    # Apply filters
-    filtered_jobs = waiting_jobs.copy()
+    # Apply filters as one combined mask so the frame is sliced once
+    mask = np.ones(len(waiting_jobs), dtype=bool)
 
     if selected_status != 'All':
-        filtered_jobs = filtered_jobs[filtered_jobs['job_status'] == selected_status]
+        mask &= (waiting_jobs['job_status'] == selected_status).to_numpy()
 
     if selected_priority != 'All':
-        filtered_jobs = filtered_jobs[filtered_jobs['priority'] == selected_priority]
+        mask &= (waiting_jobs['priority'] == selected_priority).to_numpy()
+
+    filtered_jobs = waiting_jobs[mask]
 
     # Display filtered jobs
     st.write(f"Showing {len(filtered_jobs)} jobs")
@@ -225,11 +247,9 @@ def render_jobs_waiting_for_parts(jobs_df: pd.DataFrame, lang: Language):
         'parts_status'
     ]
 
-    display_df = filtered_jobs[display_columns].copy()
-
-    # Format datetime
-    display_df['scheduled_start_time'] = display_df['scheduled_start_time'].apply(
-        lambda x: format_datetime(x) if pd.notna(x) else 'N/A'
+    # Format dates here so missing ones read "N/A" rather than a blank cell
+    display_df = filtered_jobs[display_columns].assign(
+        scheduled_start_time=format_datetime_column(filtered_jobs['scheduled_start_time'])
     )
 
     # Rename columns
@@ -252,10 +272,10 @@ def render_jobs_waiting_for_parts(jobs_df: pd.DataFrame, lang: Language):
     # Export option
     st.divider()
 
-    csv = filtered_jobs.to_csv(index=False)
+    # Serialized only when clicked, not on every rerun of the fragment
     st.download_button(
         label="Export Waiting Jobs as CSV",
-        data=csv,
+        data=lambda: df_to_csv(filtered_jobs),
         file_name="jobs_waiting_for_parts.csv",
         mime="text/csv"
     )
@@ -66,6 +66,7 @@ class AppSettings:
     API_TIMEOUT_SECONDS = 30
     API_MAX_RETRIES = 3
     API_RATE_LIMIT_PER_MINUTE = 100
+    API_MAX_CONCURRENT_REQUESTS = 8  # Page fetches in flight during a sync
 
     # Database settings
     DB_CONNECTION_POOL_MIN = 1
@@ -73,6 +74,7 @@ class AppSettings:
     DB_QUERY_TIMEOUT_SECONDS = 30
 
     # Cache settings (Streamlit cache TTL in seconds)
+    CACHE_TTL_VERY_SHORT = 30  # 30 seconds
     CACHE_TTL_SHORT = 300      # 5 minutes
     CACHE_TTL_MEDIUM = 900     # 15 minutes
     CACHE_TTL_LONG = 3600      # 1 hour
@@ -80,6 +82,7 @@ class AppSettings:
     # Export settings
     EXPORT_MAX_ROWS = 10000
     EXPORT_FORMATS = ["CSV", "JSON", "Excel"]
+    EXPORT_CACHE_MAX_ENTRIES = 8  # Serialized payloads kept per format
 
     @classmethod
     def get_sync_interval(cls) -> int:
@@ -166,6 +169,7 @@ class FeatureFlags:
     ENABLE_BULK_LOOKUP = True
     ENABLE_PARTS_INVENTORY = True
     ENABLE_EXPORT = True
+    ENABLE_COMPACT_STATUS_TILES = True  # Hide status tiles that have no jobs
 
     # Sync features
     ENABLE_MANUAL_SYNC = True
@@ -5,6 +5,7 @@ Uses SQLite for local data storage.
 
 from database.connection import (
     get_db_connection,
+    get_connection,
     execute_query,
     execute_many,
     is_database_configured,
@@ -14,6 +15,7 @@ from database.queries import JobQueries
 
 __all__ = [
     'get_db_connection',
+    'get_connection',
     'execute_query',
     'execute_many',
     'is_database_configured',
@@ -5,7 +5,8 @@ Handles SQLite connections - no external database server required.
 
 import streamlit as st
 import sqlite3
-from typing import Optional, List, Tuple, Any
+from contextlib import contextmanager
+from typing import Iterator, Optional, List, Tuple, Any, Union
 import logging
 import os
 from pathlib import Path
@@ -16,6 +17,12 @@ logger = logging.getLogger(__name__)
 DB_DIR = Path(__file__).parent.parent / "data"
 DB_FILE = DB_DIR / "eu_parts_jobs.db"
 
+# Compiled statements kept per connection. sqlite3 reuses a prepared
+# statement whenever the exact SQL text repeats; the default of 128 is
+# easily churned by the IN (?, ?, ...) lookups, whose text varies with
+# the number of job numbers, evicting the sync and dashboard queries.
+STATEMENT_CACHE_SIZE = 512
+
 
 class DatabaseNotConfiguredError(Exception):
     """Raised when database configuration is missing."""
@@ -45,6 +52,26 @@ def is_database_configured() -> bool:
     return True
 
 
+def _connect() -> sqlite3.Connection:
+    """
+    Open a new SQLite connection with the app's connection settings.
+
+    Returns:
+        SQLite connection object
+    """
+    conn = sqlite3.connect(
+        get_db_path(),
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE
+    )
+    conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+
+    # Enable foreign keys
+    conn.execute("PRAGMA foreign_keys = ON")
+
+    return conn
+
+
 @st.cache_resource
 def get_db_connection():
     """
@@ -54,14 +81,9 @@ def get_db_connection():
     Returns:
         SQLite connection object
     """
-    db_path = get_db_path()
-    logger.info(f"Connecting to SQLite database at {db_path}")
+    logger.info(f"Connecting to SQLite database at {get_db_path()}")
 
-    conn = sqlite3.connect(db_path, check_same_thread=False)
-    conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
-
-    # Enable foreign keys
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn = _connect()
 
     # Initialize database schema if needed
     _initialize_schema(conn)
@@ -69,6 +91,34 @@ def get_db_connection():
     return conn
 
 
+@contextmanager
+def get_connection() -> Iterator[sqlite3.Connection]:
+    """
+    Open a dedicated connection for a multi-statement write.
+
+    Unlike get_db_connection(), the connection is not shared with other
+    sessions, so an execute_query() commit elsewhere can't commit this
+    connection's open transaction halfway through. Pending writes are
+    committed when the block exits normally and rolled back if it raises;
+    the connection is closed either way.
+
+    Yields:
+        SQLite connection object
+    """
+    # Make sure the schema exists before writing through a fresh connection
+    get_db_connection()
+
+    conn = _connect()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def _initialize_schema(conn: sqlite3.Connection):
     """
     Initialize the database schema if tables don't exist.
@@ -128,22 +178,36 @@ def _run_migrations(conn: sqlite3.Connection):
         conn.commit()
         logger.info("Migration complete: asset_uid column added")
 
+    # Status filter/count index, added after the initial schema
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_category_status
+        ON jobs(job_category, job_status, latitude, longitude)
+    """)
+    conn.commit()
+
     cursor.close()
 
 
-def execute_query(query: str, params: tuple = None, fetch: bool = True) -> Optional[Tuple[List, List[str]]]:
+def execute_query(
+    query: str,
+    params: Union[tuple, dict] = None,
+    fetch: bool = True,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Tuple[List, List[str]]]:
     """
     Execute a SQL query with automatic connection management.
 
     Args:
         query: SQL query string
-        params: Query parameters (optional)
+        params: Query parameters, positional tuple or named dict (optional)
         fetch: Whether to fetch results (default: True)
+        conn: Connection to use (default: the cached connection)
 
     Returns:
         Tuple of (results, column_names) if fetch=True, otherwise None
     """
-    conn = get_db_connection()
+    if conn is None:
+        conn = get_db_connection()
     cursor = None
 
     try:
@@ -177,18 +241,20 @@ def execute_query(query: str, params: tuple = None, fetch: bool = True) -> Optio
             cursor.close()
 
 
-def execute_many(query: str, data: list) -> int:
+def execute_many(query: str, data: list, conn: Optional[sqlite3.Connection] = None) -> int:
     """
     Execute a query with multiple parameter sets (batch insert/update).
 
     Args:
         query: SQL query string with parameter placeholders
         data: List of parameter tuples
+        conn: Connection to use (default: the cached connection)
 
     Returns:
         Number of rows affected
     """
-    conn = get_db_connection()
+    if conn is None:
+        conn = get_db_connection()
     cursor = None
 
     try:
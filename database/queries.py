@@ -67,6 +67,55 @@ class JobQueries:
             logger.error(f"Error fetching EU parts jobs: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def get_eu_parts_jobs_for_dashboard() -> pd.DataFrame:
+        """
+        Get EU parts jobs with only the columns the dashboard uses.
+
+        The dashboard's tiles, filters, card and table views, map, export
+        and AI context, and the parts inventory page, need a subset of the
+        schema; leaving out the JSON custom_fields/tags and the unused id
+        columns keeps the cached DataFrames and every filter over them
+        smaller. Pages that show a job's full detail use the single-job
+        lookups instead.
+
+        Returns:
+            DataFrame with EU parts jobs
+        """
+        query = """
+        SELECT
+            job_uid,
+            job_number,
+            title,
+            description,
+            job_status,
+            priority,
+            customer_name,
+            asset_name,
+            latitude,
+            longitude,
+            assigned_technician,
+            scheduled_start_time,
+            scheduled_end_time,
+            modified_time,
+            parts_status,
+            parts_delivered_date
+        FROM jobs
+        WHERE
+            job_category = 'Field Requires Parts'
+            AND latitude BETWEEN 35 AND 72
+            AND longitude BETWEEN -11 AND 40
+        ORDER BY scheduled_start_time DESC
+        """
+
+        try:
+            results, columns = execute_query(query)
+            df = pd.DataFrame(results, columns=columns)
+            return df
+        except Exception as e:
+            logger.error(f"Error fetching EU parts jobs for dashboard: {e}")
+            return pd.DataFrame()
+
     @staticmethod
     def get_jobs_by_status(statuses: List[str]) -> pd.DataFrame:
         """
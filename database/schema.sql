@@ -59,6 +59,9 @@ CREATE INDEX IF NOT EXISTS idx_job_category ON jobs(job_category);
 CREATE INDEX IF NOT EXISTS idx_customer_name ON jobs(customer_name);
 CREATE INDEX IF NOT EXISTS idx_scheduled_start ON jobs(scheduled_start_time);
 CREATE INDEX IF NOT EXISTS idx_location ON jobs(latitude, longitude);
+-- Every EU parts query filters on category + coordinates; leading with
+-- job_status after category serves status filters and per-status counts
+CREATE INDEX IF NOT EXISTS idx_category_status ON jobs(job_category, job_status, latitude, longitude);
 
 -- Sync log table to track synchronization operations
 CREATE TABLE IF NOT EXISTS sync_log (
@@ -3,16 +3,15 @@ Anthropic API client for AI-powered dashboard features.
 Provides natural language search, job analysis, and intelligent assistance.
 """
 
+import importlib.util
 import logging
 from typing import Dict, List, Optional, Any
 import json
 import streamlit as st
 
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# The SDK is imported when a client is first built; the dashboard checks
+# availability on every render and shouldn't pay the SDK's import cost for it
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +107,8 @@ Always be helpful and professional. Focus on actionable insights."""
         anthropic_config = st.secrets.get("anthropic", {})
         self.api_key = api_key or anthropic_config.get("api_key")
 
+        import anthropic
+
         self.client = anthropic.Anthropic(api_key=self.api_key)
         self.model = "claude-sonnet-4-20250514"
 
@@ -132,6 +133,8 @@ Always be helpful and professional. Focus on actionable insights."""
         Returns:
             Dictionary with response and any parsed actions
         """
+        import anthropic
+
         # Build context-aware system prompt
         system = self.SYSTEM_PROMPT
 
@@ -5,19 +5,234 @@ Handles data synchronization from Zuper to SQLite database.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import json
+import sqlite3
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from src.zuper_api.client import ZuperAPIClient
-from database.connection import execute_query, get_db_connection
+from database.connection import execute_query, get_connection
 from src.zuper_api.exceptions import ZuperAPIError
 
 logger = logging.getLogger(__name__)
 
+# Columns a sync writes, in jobs table order; the stage and merge SQL are
+# generated from this one list, and _build_job_row returns a row keyed by
+# exactly these names. last_synced is stamped by the merge itself.
+_JOB_COLUMNS = (
+    "job_uid",
+    "job_number",
+    "title",
+    "description",
+    "job_status",
+    "job_category",
+    "priority",
+    "customer_name",
+    "customer_uid",
+    "asset_name",
+    "asset_uid",
+    "job_address",
+    "latitude",
+    "longitude",
+    "assigned_technician",
+    "technician_uid",
+    "scheduled_start_time",
+    "scheduled_end_time",
+    "actual_start_time",
+    "actual_end_time",
+    "created_time",
+    "modified_time",
+    "parts_status",
+    "parts_delivered_date",
+    "custom_fields",
+    "tags",
+)
+
+_SQL_LIST_SEPARATOR = ",\n        "
+_COLUMN_LIST_SQL = _SQL_LIST_SEPARATOR.join(_JOB_COLUMNS)
+_NAMED_PARAMS_SQL = _SQL_LIST_SEPARATOR.join(f":{column}" for column in _JOB_COLUMNS)
+_UPDATE_SET_SQL = _SQL_LIST_SEPARATOR.join(
+    f"{column} = excluded.{column}" for column in _JOB_COLUMNS if column != "job_uid"
+)
+
+# Serialized forms of the empty custom_fields / tags most jobs carry
+_EMPTY_JSON_OBJECT = "{}"
+_EMPTY_JSON_ARRAY = "[]"
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _is_plain_utc_iso(dt_string: str) -> bool:
+    """Check for "YYYY-MM-DDTHH:MM:SS", optionally followed by ".fff" and/or "Z"."""
+    if (
+        len(dt_string) < 19
+        or dt_string[4] != '-' or dt_string[7] != '-' or dt_string[10] != 'T'
+        or dt_string[13] != ':' or dt_string[16] != ':'
+    ):
+        return False
+
+    digits = (
+        dt_string[0:4] + dt_string[5:7] + dt_string[8:10]
+        + dt_string[11:13] + dt_string[14:16] + dt_string[17:19]
+    )
+    if not (digits.isascii() and digits.isdigit()):
+        return False
+
+    suffix = dt_string[19:]
+    if suffix.endswith('Z'):
+        suffix = suffix[:-1]
+    return not suffix or (suffix[0] == '.' and suffix[1:].isascii() and suffix[1:].isdigit())
+
+
+@lru_cache(maxsize=4096)
+def _format_datetime(dt_string: Optional[str]) -> Optional[str]:
+    """
+    Format datetime string for SQLite storage.
+    Cached: Zuper payloads repeat the same timestamps across many jobs.
+
+    Args:
+        dt_string: Datetime string in ISO format
+
+    Returns:
+        ISO format datetime string or None
+    """
+    if not dt_string:
+        return None
+
+    try:
+        # Fast path for Zuper's usual UTC shape, "YYYY-MM-DDTHH:MM:SS" with
+        # an optional ".fff" and "Z": constructing the datetime validates
+        # the fields, and slicing replaces the isoformat parse + strftime
+        if _is_plain_utc_iso(dt_string):
+            datetime(
+                int(dt_string[0:4]), int(dt_string[5:7]), int(dt_string[8:10]),
+                int(dt_string[11:13]), int(dt_string[14:16]), int(dt_string[17:19])
+            )
+            return f"{dt_string[:10]} {dt_string[11:19]}"
+
+        # Handle ISO format with timezone
+        if 'T' in dt_string:
+            if dt_string[-1] == 'Z':
+                dt_string = dt_string[:-1] + '+00:00'
+            dt = datetime.fromisoformat(dt_string)
+            return dt.strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            return dt_string
+    except (ValueError, AttributeError) as e:
+        logger.warning(f"Failed to parse datetime: {dt_string}, error: {e}")
+        return None
+
 
 class SyncManager:
     """Manages synchronization between Zuper API and local database."""
 
+    # Jobs written per executemany/SAVEPOINT batch during sync
+    UPSERT_CHUNK_SIZE = 500
+
+    # Per-connection scratch table each chunk is staged into before it is
+    # merged into jobs; same columns as jobs, none of its constraints.
+    CREATE_STAGING_TABLE_QUERY = """
+    CREATE TEMP TABLE IF NOT EXISTS jobs_staging AS
+    SELECT * FROM jobs WHERE 0
+    """
+
+    CLEAR_STAGING_TABLE_QUERY = "DELETE FROM jobs_staging"
+
+    # Named-parameter insert: rows are dicts keyed by column name, so the
+    # bindings can't drift out of order with the column list.
+    STAGE_JOB_QUERY = f"""
+    INSERT INTO jobs_staging (
+        {_COLUMN_LIST_SQL}
+    ) VALUES (
+        {_NAMED_PARAMS_SQL}
+    )
+    """
+
+    # Staged jobs whose job_uid is not in jobs yet
+    COUNT_NEW_STAGED_JOBS_QUERY = """
+    SELECT COUNT(DISTINCT s.job_uid)
+    FROM jobs_staging s
+    LEFT JOIN jobs j ON j.job_uid = s.job_uid
+    WHERE j.job_uid IS NULL
+    """
+
+    # Staged jobs already stored with the same or a newer modified_time;
+    # unless :full_sync is set these are left untouched by the merge
+    COUNT_UNCHANGED_STAGED_JOBS_QUERY = """
+    SELECT COUNT(*)
+    FROM jobs_staging s
+    JOIN jobs j ON j.job_uid = s.job_uid
+    WHERE
+        NOT :full_sync
+        AND s.modified_time IS NOT NULL
+        AND j.modified_time IS NOT NULL
+        AND s.modified_time <= j.modified_time
+    """
+
+    # Stored jobs whose job_number a staged job with a different job_uid
+    # is about to take over (Zuper reused the number, or the job was
+    # recreated). INSERT OR REPLACE used to drop such rows implicitly;
+    # the ON CONFLICT(job_uid) merge below would instead fail the
+    # job_number UNIQUE constraint on every sync. Only staged rows the
+    # merge will actually write claim their number, mirroring its WHERE.
+    DELETE_REUSED_JOB_NUMBERS_QUERY = """
+    DELETE FROM jobs
+    WHERE
+        job_number IN (
+            SELECT s.job_number
+            FROM jobs_staging s
+            LEFT JOIN jobs j ON j.job_uid = s.job_uid
+            WHERE
+                :full_sync
+                OR j.job_uid IS NULL
+                OR s.modified_time IS NULL
+                OR j.modified_time IS NULL
+                OR s.modified_time > j.modified_time
+        )
+        AND job_uid NOT IN (
+            SELECT s.job_uid
+            FROM jobs_staging s
+            WHERE s.job_number = jobs.job_number
+        )
+    """
+
+    # ON CONFLICT updates the existing row in place rather than deleting
+    # and re-inserting it as INSERT OR REPLACE does, and only when the job
+    # changed since it was stored. "WHERE true" is required by SQLite to
+    # parse an upsert on INSERT ... SELECT.
+    MERGE_STAGED_JOBS_QUERY = f"""
+    INSERT INTO jobs (
+        {_COLUMN_LIST_SQL},
+        last_synced
+    )
+    SELECT
+        {_COLUMN_LIST_SQL},
+        datetime('now')
+    FROM jobs_staging
+    WHERE true
+    ORDER BY rowid
+    ON CONFLICT(job_uid) DO UPDATE SET
+        {_UPDATE_SET_SQL},
+        last_synced = excluded.last_synced
+    WHERE
+        :full_sync
+        OR excluded.modified_time IS NULL
+        OR jobs.modified_time IS NULL
+        OR excluded.modified_time > jobs.modified_time
+    """
+
     def __init__(self, api_client: ZuperAPIClient):
         """
         Initialize sync manager.
@@ -27,10 +242,35 @@ class SyncManager:
         """
         self.api_client = api_client
 
-    def sync_all_jobs(self) -> Dict[str, Any]:
+        # The dashboard shares one SyncManager across sessions; only one
+        # sync may write at a time
+        self._sync_lock = threading.Lock()
+
+    def sync_all_jobs(self, full_sync: bool = False) -> Dict[str, Any]:
         """
         Synchronize all EU parts jobs from Zuper API to database.
 
+        Jobs whose modified_time is not newer than the stored copy are
+        skipped unless full_sync is set.
+
+        Concurrent calls on the same SyncManager run one after another.
+
+        Args:
+            full_sync: Rewrite every job regardless of modified_time
+
+        Returns:
+            Dictionary with sync statistics
+        """
+        with self._sync_lock:
+            return self._run_sync(full_sync)
+
+    def _run_sync(self, full_sync: bool) -> Dict[str, Any]:
+        """
+        Run one sync; see sync_all_jobs.
+
+        Args:
+            full_sync: Rewrite every job regardless of modified_time
+
         Returns:
             Dictionary with sync statistics
         """
@@ -40,33 +280,47 @@ class SyncManager:
             "jobs_fetched": 0,
             "jobs_created": 0,
             "jobs_updated": 0,
+            "jobs_skipped": 0,
+            "sync_id": None,
             "errors": [],
             "status": "running"
         }
 
         try:
-            # Log sync start
-            self._log_sync_start(sync_start)
-
-            # Fetch EU parts jobs from API
-            logger.info("Fetching EU parts jobs from Zuper API")
-            eu_jobs = self.api_client.get_eu_parts_jobs()
-            stats["jobs_fetched"] = len(eu_jobs)
-
-            logger.info(f"Fetched {len(eu_jobs)} EU parts jobs from API")
-
-            # Prepare batch upsert
-            for job in eu_jobs:
-                try:
-                    result = self._upsert_job(job)
-                    if result == "created":
-                        stats["jobs_created"] += 1
-                    elif result == "updated":
-                        stats["jobs_updated"] += 1
-                except Exception as e:
-                    error_msg = f"Error upserting job {job.get('work_order_number', 'unknown')}: {str(e)}"
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
+            # A dedicated connection carries the sync: every page's writes
+            # stay in one transaction, committed once when the block exits
+            # and rolled back as a whole if the sync fails
+            with get_connection() as conn:
+                # Log sync start (committed on its own, before any job writes)
+                stats["sync_id"] = self._log_sync_start(sync_start, conn)
+
+                # Explicit BEGIN so the per-chunk savepoints nest inside one
+                # transaction; an outermost RELEASE would commit each chunk
+                conn.execute("BEGIN")
+
+                # Stream EU parts jobs from the API page by page, upserting
+                # each page as it arrives rather than buffering every job
+                logger.info("Fetching EU parts jobs from Zuper API")
+                seen: Dict[str, str] = {}
+                duplicates = 0
+                failed_pages: List[int] = []
+                for page_jobs in self.api_client.iter_eu_parts_jobs_pages(failed_pages):
+                    page_jobs = self._drop_jobs_without_uid(page_jobs, stats)
+                    eu_jobs = self._dedupe_jobs(page_jobs, seen)
+                    duplicates += len(page_jobs) - len(eu_jobs)
+                    stats["jobs_fetched"] += len(eu_jobs)
+
+                    # Batch upsert in savepoint-guarded chunks
+                    self._upsert_jobs(eu_jobs, stats, conn, full_sync)
+
+                if duplicates:
+                    logger.info(f"Dropped {duplicates} duplicate jobs repeated across pages")
+                if failed_pages:
+                    stats["errors"].append(
+                        f"Failed to fetch API pages {', '.join(map(str, failed_pages))}; "
+                        f"jobs on those pages were not synced"
+                    )
+                logger.info(f"Fetched {stats['jobs_fetched']} EU parts jobs from API")
 
             # Mark sync as completed
             stats["status"] = "completed"
@@ -76,6 +330,7 @@ class SyncManager:
             logger.info(
                 f"Sync completed: {stats['jobs_created']} created, "
                 f"{stats['jobs_updated']} updated, "
+                f"{stats['jobs_skipped']} unchanged, "
                 f"{len(stats['errors'])} errors"
             )
 
@@ -83,80 +338,221 @@ class SyncManager:
             stats["status"] = "failed"
             stats["errors"].append(f"API error: {str(e)}")
             logger.error(f"Sync failed due to API error: {e}")
+            self._discard_rolled_back_counts(stats)
 
         except Exception as e:
             stats["status"] = "failed"
             stats["errors"].append(f"Unexpected error: {str(e)}")
             logger.error(f"Sync failed due to unexpected error: {e}")
+            self._discard_rolled_back_counts(stats)
 
         finally:
-            # Log sync completion
+            # Log sync completion (the sync connection is closed by now)
             self._log_sync_completion(stats)
 
         return stats
 
-    def _upsert_job(self, job_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _discard_rolled_back_counts(stats: Dict[str, Any]):
         """
-        Insert or update a job in the database using SQLite upsert.
+        Zero the write counts of a failed sync.
+
+        A failed sync's transaction is rolled back, so none of the rows
+        counted so far were saved; sync_log should not report them.
 
         Args:
-            job_data: Job data from Zuper API
+            stats: Sync statistics dictionary, updated in place
+        """
+        if stats["jobs_created"] or stats["jobs_updated"] or stats["jobs_skipped"]:
+            logger.info(
+                f"Rolled back {stats['jobs_created']} created and "
+                f"{stats['jobs_updated']} updated jobs"
+            )
+        stats["jobs_created"] = 0
+        stats["jobs_updated"] = 0
+        stats["jobs_skipped"] = 0
+
+    @staticmethod
+    def _drop_jobs_without_uid(jobs: List[Dict[str, Any]], stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Drop jobs that have no job_uid, reporting each as skipped.
+
+        job_uid is the jobs table's primary key, but SQLite accepts NULL
+        there: such a job would be stored without a key, could never be
+        matched again, and would clash on job_number on every later sync.
+
+        Args:
+            jobs: Jobs from one API page
+            stats: Sync statistics dictionary, updated in place
 
         Returns:
-            "created" or "updated" depending on operation
+            Jobs that have a job_uid, in page order
         """
-        # Zuper API uses snake_case field names
-        job_uid = job_data.get("job_uid") or job_data.get("jobUid")
+        kept = []
+        for job in jobs:
+            if job.get("job_uid") or job.get("jobUid"):
+                kept.append(job)
+                continue
+
+            error_msg = f"Skipped job {job.get('work_order_number', 'unknown')}: no job_uid in API response"
+            logger.warning(error_msg)
+            stats["errors"].append(error_msg)
+            stats["jobs_fetched"] += 1
+            stats["jobs_skipped"] += 1
+
+        return kept
+
+    @staticmethod
+    def _dedupe_jobs(jobs: List[Dict[str, Any]], seen: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Drop jobs already seen in this sync unless this copy is newer.
 
-        # Check if job exists
-        check_query = "SELECT job_uid FROM jobs WHERE job_uid = ?"
-        result, _ = execute_query(check_query, (job_uid,))
-        job_exists = bool(result)
+        Pagination over a dataset that changes mid-sync can return the same
+        job on more than one page. Within a page only the newest copy is
+        kept; across pages a later copy is kept only if its updated_at is
+        newer than the one already written.
 
-        # SQLite INSERT OR REPLACE syntax
-        query = """
-        INSERT OR REPLACE INTO jobs (
-            job_uid,
-            job_number,
-            title,
-            description,
-            job_status,
-            job_category,
-            priority,
-            customer_name,
-            customer_uid,
-            asset_name,
-            asset_uid,
-            job_address,
-            latitude,
-            longitude,
-            assigned_technician,
-            technician_uid,
-            scheduled_start_time,
-            scheduled_end_time,
-            actual_start_time,
-            actual_end_time,
-            created_time,
-            modified_time,
-            parts_status,
-            parts_delivered_date,
-            custom_fields,
-            tags,
-            last_synced
-        ) VALUES (
-            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-            ?, ?, ?, ?, ?, ?, datetime('now')
-        )
+        Args:
+            jobs: Jobs from one API page, all with a job_uid
+            seen: job_uid -> formatted updated_at of jobs kept so far,
+                updated in place
+
+        Returns:
+            Jobs to upsert, in page order
+        """
+        by_uid: Dict[str, Dict[str, Any]] = {}
+        for job in jobs:
+            # Jobs without a uid were dropped by _drop_jobs_without_uid
+            job_uid = job.get("job_uid") or job.get("jobUid")
+            modified = _format_datetime(job.get("updated_at")) or ""
+            if job_uid in seen and seen[job_uid] >= modified:
+                continue
+
+            seen[job_uid] = modified
+            by_uid[job_uid] = job
+
+        return list(by_uid.values())
+
+    def _upsert_jobs(
+        self,
+        jobs: List[Dict[str, Any]],
+        stats: Dict[str, Any],
+        conn: sqlite3.Connection,
+        full_sync: bool = False
+    ):
+        """
+        Upsert jobs in chunks, each wrapped in a SAVEPOINT.
+
+        Each chunk is staged into a temp table and merged into jobs with a
+        single INSERT ... SELECT. If any row in it fails, the chunk is
+        rolled back to its savepoint and replayed row by row so the
+        failing jobs can be reported individually. Nothing is committed
+        here; the caller owns the enclosing transaction.
+
+        Args:
+            jobs: Job data from Zuper API
+            stats: Sync statistics dictionary, updated in place
+            conn: Database connection for the sync
+            full_sync: Rewrite jobs even if modified_time is unchanged
+        """
+        conn.execute(self.CREATE_STAGING_TABLE_QUERY)
+
+        for start in range(0, len(jobs), self.UPSERT_CHUNK_SIZE):
+            chunk = jobs[start:start + self.UPSERT_CHUNK_SIZE]
+
+            conn.execute("SAVEPOINT upsert_chunk")
+            try:
+                rows = [self._build_job_row(job) for job in chunk]
+                created, skipped = self._merge_rows(rows, conn, full_sync)
+                conn.execute("RELEASE upsert_chunk")
+
+                stats["jobs_created"] += created
+                stats["jobs_skipped"] += skipped
+                stats["jobs_updated"] += len(rows) - created - skipped
+
+            except Exception as e:
+                conn.execute("ROLLBACK TO upsert_chunk")
+                conn.execute("RELEASE upsert_chunk")
+                logger.warning(
+                    f"Batch upsert failed for jobs {start}-{start + len(chunk) - 1}, "
+                    f"retrying row by row: {e}"
+                )
+
+                for job in chunk:
+                    try:
+                        created, skipped = self._merge_rows([self._build_job_row(job)], conn, full_sync)
+                        if created:
+                            stats["jobs_created"] += 1
+                        elif skipped:
+                            stats["jobs_skipped"] += 1
+                        else:
+                            stats["jobs_updated"] += 1
+                    except Exception as e:
+                        error_msg = f"Error upserting job {job.get('work_order_number', 'unknown')}: {str(e)}"
+                        logger.error(error_msg)
+                        stats["errors"].append(error_msg)
+
+    def _merge_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        conn: sqlite3.Connection,
+        full_sync: bool = False
+    ) -> Tuple[int, int]:
         """
+        Stage rows in the temp table and merge them into jobs.
+
+        A stored job whose job_number is taken over by a staged job with a
+        different job_uid is deleted first, so the newer job wins as it
+        did under INSERT OR REPLACE.
+
+        Args:
+            rows: Job rows from _build_job_row
+            conn: Database connection for the sync
+            full_sync: Rewrite jobs even if modified_time is unchanged
+
+        Returns:
+            Tuple of (rows that created a new job, rows skipped as unchanged)
+        """
+        params = {"full_sync": full_sync}
+
+        conn.execute(self.CLEAR_STAGING_TABLE_QUERY)
+        conn.executemany(self.STAGE_JOB_QUERY, rows)
+        created = conn.execute(self.COUNT_NEW_STAGED_JOBS_QUERY).fetchone()[0]
+        skipped = conn.execute(self.COUNT_UNCHANGED_STAGED_JOBS_QUERY, params).fetchone()[0]
+
+        retired = conn.execute(self.DELETE_REUSED_JOB_NUMBERS_QUERY, params).rowcount
+        if retired:
+            logger.info(f"Removed {retired} stored jobs whose job_number was reused by another job")
+
+        conn.execute(self.MERGE_STAGED_JOBS_QUERY, params)
+        return created, skipped
+
+    def _build_job_row(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map a Zuper API job onto the named parameters of STAGE_JOB_QUERY.
+
+        Args:
+            job_data: Job data from Zuper API
+
+        Returns:
+            Dictionary of column name to value
+        """
+        # Bound once: this runs for every job and does ~25 lookups
+        get = job_data.get
+
+        # Zuper API uses snake_case field names
+        job_uid = get("job_uid") or get("jobUid")
 
         # Convert tags list to JSON string for SQLite
-        tags = job_data.get("job_tags", [])
+        tags = get("job_tags", [])
         if isinstance(tags, list):
-            tags = json.dumps(tags)
+            tags = _json_dumps(tags) if tags else _EMPTY_JSON_ARRAY
+
+        custom_fields = get("custom_fields")
+        custom_fields = _json_dumps(custom_fields) if custom_fields else _EMPTY_JSON_OBJECT
 
         # Extract location data - Zuper uses customer_address.geo_cordinates as array [lat, lng]
-        location = job_data.get("customer_address", {}) or {}
+        location = get("customer_address", {}) or {}
         geo_coords = location.get("geo_cordinates", [])
         lat, lon = None, None
         if isinstance(geo_coords, list) and len(geo_coords) >= 2:
@@ -164,32 +560,29 @@ class SyncManager:
             lon = geo_coords[1]
 
         # Get job category name from nested object
-        job_category = job_data.get("job_category", {})
+        job_category = get("job_category", {})
         if isinstance(job_category, dict):
             job_category = job_category.get("category_name") or job_category.get("name")
 
         # Get current job status from current_job_status object
-        current_status = job_data.get("current_job_status", {})
+        current_status = get("current_job_status", {})
         if isinstance(current_status, dict):
             job_status = current_status.get("status_name") or current_status.get("name")
         else:
             job_status = None
 
         # Get customer info - customer is just a string UID in the list response
-        customer_uid = job_data.get("customer")
+        customer_uid = get("customer")
         if isinstance(customer_uid, dict):
             customer_uid = customer_uid.get("customer_uid") or str(customer_uid)
 
         # Get customer name from customer_address
-        customer_name = location.get("first_name") or job_data.get("customer_name")
+        customer_name = location.get("first_name") or get("customer_name")
         if isinstance(customer_name, dict):
             customer_name = customer_name.get("name") or str(customer_name)
 
-        # Address not needed - only GPS coordinates are used for EU filtering
-        job_address = None
-
         # Get assigned user info
-        assigned_to = job_data.get("assigned_to", []) or []
+        assigned_to = get("assigned_to", []) or []
         assigned_technician = None
         technician_uid = None
         if assigned_to and isinstance(assigned_to, list) and len(assigned_to) > 0:
@@ -201,7 +594,7 @@ class SyncManager:
                 technician_uid = first_tech.get("user_uid")
 
         # Get work_order_number, fall back to job_uid prefix if not available
-        work_order_number = job_data.get("work_order_number")
+        work_order_number = get("work_order_number")
         if work_order_number is None:
             # Use last 8 chars of job_uid as a fallback identifier
             work_order_number = f"JOB-{job_uid[-8:]}" if job_uid else None
@@ -211,14 +604,14 @@ class SyncManager:
         asset_uid = None
 
         # Try 'property' field first (common in Zuper)
-        property_data = job_data.get("property", {}) or {}
+        property_data = get("property", {}) or {}
         if isinstance(property_data, dict):
             asset_name = property_data.get("property_name") or property_data.get("name")
             asset_uid = property_data.get("property_uid") or property_data.get("uid")
 
         # Try 'assets' array if property not found
         if not asset_name:
-            assets = job_data.get("assets", []) or []
+            assets = get("assets", []) or []
             if assets and isinstance(assets, list) and len(assets) > 0:
                 first_asset = assets[0]
                 if isinstance(first_asset, dict):
@@ -227,87 +620,66 @@ class SyncManager:
 
         # Extract and prepare job data using Zuper API snake_case field names
         # and already-extracted variables from above
-        params = (
-            job_uid,
-            work_order_number,  # Zuper uses work_order_number
-            job_data.get("job_title"),  # Zuper uses job_title
-            job_data.get("job_description"),  # Zuper uses job_description
-            job_status,  # Already extracted from current_job_status.status_name
-            job_category,  # Already extracted from job_category.category_name
-            job_data.get("job_priority"),  # Zuper uses job_priority
-            customer_name,  # Already extracted from customer_address.first_name
-            customer_uid,  # Already extracted from customer field
-            asset_name,  # Extracted from property or assets
-            asset_uid,  # Extracted from property or assets
-            job_address,  # Already extracted from customer_address components
-            lat,  # Already extracted from customer_address.geo_cordinates
-            lon,  # Already extracted from customer_address.geo_cordinates
-            assigned_technician,  # Already extracted from assigned_to array
-            technician_uid,  # Already extracted from assigned_to array
-            self._format_datetime(job_data.get("scheduled_start_time")),
-            self._format_datetime(job_data.get("scheduled_end_time")),
-            self._format_datetime(job_data.get("work_start_time")),  # Zuper uses work_start_time
-            self._format_datetime(job_data.get("work_end_time")),  # Zuper uses work_end_time
-            self._format_datetime(job_data.get("created_at")),  # Zuper uses created_at
-            self._format_datetime(job_data.get("updated_at")),  # Zuper uses updated_at
-            job_data.get("parts_status"),  # Zuper uses snake_case
-            self._format_datetime(job_data.get("parts_delivered_date")),
-            json.dumps(job_data.get("custom_fields", {})),  # Zuper uses snake_case
-            tags
-        )
-
-        execute_query(query, params, fetch=False)
-
-        return "updated" if job_exists else "created"
-
-    def _format_datetime(self, dt_string: Optional[str]) -> Optional[str]:
-        """
-        Format datetime string for SQLite storage.
-
-        Args:
-            dt_string: Datetime string in ISO format
-
-        Returns:
-            ISO format datetime string or None
-        """
-        if not dt_string:
-            return None
-
-        try:
-            # Handle ISO format with timezone
-            if 'T' in dt_string:
-                dt_string = dt_string.replace('Z', '+00:00')
-                dt = datetime.fromisoformat(dt_string)
-                return dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                return dt_string
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse datetime: {dt_string}, error: {e}")
-            return None
+        return {
+            "job_uid": job_uid,
+            "job_number": work_order_number,  # Zuper uses work_order_number
+            "title": get("job_title"),  # Zuper uses job_title
+            "description": get("job_description"),  # Zuper uses job_description
+            "job_status": job_status,  # Already extracted from current_job_status.status_name
+            "job_category": job_category,  # Already extracted from job_category.category_name
+            "priority": get("job_priority"),  # Zuper uses job_priority
+            "customer_name": customer_name,  # Already extracted from customer_address.first_name
+            "customer_uid": customer_uid,  # Already extracted from customer field
+            "asset_name": asset_name,  # Extracted from property or assets
+            "asset_uid": asset_uid,  # Extracted from property or assets
+            "job_address": None,  # Address not needed - only GPS coordinates are used for EU filtering
+            "latitude": lat,  # Already extracted from customer_address.geo_cordinates
+            "longitude": lon,  # Already extracted from customer_address.geo_cordinates
+            "assigned_technician": assigned_technician,  # Already extracted from assigned_to array
+            "technician_uid": technician_uid,  # Already extracted from assigned_to array
+            "scheduled_start_time": _format_datetime(get("scheduled_start_time")),
+            "scheduled_end_time": _format_datetime(get("scheduled_end_time")),
+            "actual_start_time": _format_datetime(get("work_start_time")),  # Zuper uses work_start_time
+            "actual_end_time": _format_datetime(get("work_end_time")),  # Zuper uses work_end_time
+            "created_time": _format_datetime(get("created_at")),  # Zuper uses created_at
+            "modified_time": _format_datetime(get("updated_at")),  # Zuper uses updated_at
+            "parts_status": get("parts_status"),  # Zuper uses snake_case
+            "parts_delivered_date": _format_datetime(get("parts_delivered_date")),
+            "custom_fields": custom_fields,  # Zuper uses snake_case
+            "tags": tags
+        }
 
-    def _log_sync_start(self, sync_time: datetime):
+    def _log_sync_start(self, sync_time: datetime, conn: Optional[sqlite3.Connection] = None) -> Optional[int]:
         """
         Log sync start in database.
 
         Args:
             sync_time: Sync start timestamp
+            conn: Database connection (default: the cached connection)
+
+        Returns:
+            sync_id of the new sync_log row, or None if logging failed
         """
         query = """
         INSERT INTO sync_log (sync_started, status)
         VALUES (?, 'running')
+        RETURNING sync_id
         """
 
         try:
-            execute_query(query, (sync_time.strftime('%Y-%m-%d %H:%M:%S'),), fetch=False)
+            results, _ = execute_query(query, (sync_time.isoformat(sep=' ', timespec='seconds'),), conn=conn)
+            return results[0][0]
         except Exception as e:
             logger.error(f"Failed to log sync start: {e}")
+            return None
 
-    def _log_sync_completion(self, stats: Dict[str, Any]):
+    def _log_sync_completion(self, stats: Dict[str, Any], conn: Optional[sqlite3.Connection] = None):
         """
         Log sync completion in database.
 
         Args:
             stats: Sync statistics dictionary
+            conn: Database connection (default: the cached connection)
         """
         query = """
         UPDATE sync_log
@@ -317,20 +689,21 @@ class SyncManager:
             jobs_fetched = ?,
             jobs_updated = ?,
             jobs_created = ?,
+            jobs_skipped = ?,
             errors = ?
-        WHERE sync_started = ?
+        WHERE sync_id = ?
         """
 
-        error_text = '\n'.join(stats.get("errors", [])) if stats.get("errors") else None
-        completed = stats.get("completed")
-        completed_str = completed.strftime('%Y-%m-%d %H:%M:%S') if completed else None
-        started_str = stats.get("started").strftime('%Y-%m-%d %H:%M:%S') if stats.get("started") else None
+        sync_id = stats.get("sync_id")
+        if sync_id is None:
+            # Start was never logged, so there is no row to complete
+            return
 
-        completed = stats.get("completed")
-        completed_str = completed.strftime('%Y-%m-%d %H:%M:%S') if completed else None
+        errors = stats.get("errors")
+        error_text = '\n'.join(errors) if errors else None
 
-        started = stats.get("started")
-        started_str = started.strftime('%Y-%m-%d %H:%M:%S') if started else None
+        completed = stats.get("completed")
+        completed_str = completed.isoformat(sep=' ', timespec='seconds') if completed else None
 
         params = (
             completed_str,
@@ -338,16 +711,18 @@ class SyncManager:
             stats.get("jobs_fetched", 0),
             stats.get("jobs_updated", 0),
             stats.get("jobs_created", 0),
+            stats.get("jobs_skipped", 0),
             error_text,
-            started_str
+            sync_id
         )
 
         try:
-            execute_query(query, params, fetch=False)
+            execute_query(query, params, fetch=False, conn=conn)
         except Exception as e:
             logger.error(f"Failed to log sync completion: {e}")
 
-    def get_last_sync_info(self) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def get_last_sync_info() -> Optional[Dict[str, Any]]:
         """
         Get information about the last sync operation.
 
@@ -362,9 +737,10 @@ class SyncManager:
             jobs_fetched,
             jobs_updated,
             jobs_created,
+            jobs_skipped,
             errors
         FROM sync_log
-        ORDER BY sync_started DESC
+        ORDER BY sync_id DESC
         LIMIT 1
         """
 
@@ -4,12 +4,26 @@ This is a READ-ONLY client that only fetches data from Zuper API.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+import threading
 import time
 import streamlit as st
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from config.settings import AppSettings
 from src.zuper_api.exceptions import (
     ZuperAPIError,
     ZuperAuthenticationError,
@@ -22,12 +36,21 @@ from src.zuper_api.exceptions import (
 
 logger = logging.getLogger(__name__)
 
-
 class ZuperAPINotConfiguredError(Exception):
     """Raised when Zuper API configuration is missing."""
     pass
 
 
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise ZuperAPIError(f"Invalid JSON response: {e}")
+    return response.json()
+
+
 def is_zuper_configured() -> bool:
     """Check if Zuper API secrets are configured."""
     try:
@@ -44,6 +67,12 @@ class ZuperAPIClient:
     READ-ONLY operations for fetching job data.
     """
 
+    # Pages fetched concurrently once page 1 has reported total_pages
+    MAX_PAGE_WORKERS = AppSettings.API_MAX_CONCURRENT_REQUESTS
+
+    # GET responses kept for conditional requests (one per page of jobs)
+    MAX_CONDITIONAL_CACHE_ENTRIES = 50
+
     def __init__(self, api_key: str = None, base_url: str = None):
         """
         Initialize Zuper API client.
@@ -80,28 +109,61 @@ class ZuperAPIClient:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
-        # Rate limiting
-        self.request_count = 0
-        self.request_window_start = time.time()
-        self.max_requests_per_minute = 100
+        # Keep-alive pool sized for the concurrent page fetches so each
+        # worker reuses its TCP/TLS connection; retries are handled in
+        # _make_request, so the adapter itself never retries.
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_PAGE_WORKERS,
+            pool_maxsize=self.MAX_PAGE_WORKERS,
+            max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Proxy/verify/cert settings from the environment are the same for
+        # every request to base_url, so resolve them once instead of on
+        # every Session.request call
+        self._send_settings = self.session.merge_environment_settings(
+            self.base_url, {}, None, None, None
+        )
+
+        # Rate limiting: token bucket shared by concurrent page fetches
+        self._rate_limit_lock = threading.Lock()
+        self.max_requests_per_minute = AppSettings.API_RATE_LIMIT_PER_MINUTE
+        self._tokens = float(self.max_requests_per_minute)
+        self._last_refill = time.monotonic()
+
+        # Validators and bodies of recent GET responses, keyed by URL and
+        # params, least recently used first
+        self._conditional_cache: "OrderedDict[Tuple, Tuple[Dict[str, str], Any]]" = OrderedDict()
+        self._conditional_cache_lock = threading.Lock()
 
     def _handle_rate_limit(self):
-        """Handle rate limiting for API requests."""
-        self.request_count += 1
-
-        # Reset counter after 60 seconds
-        if time.time() - self.request_window_start > 60:
-            self.request_count = 1
-            self.request_window_start = time.time()
-
-        # If approaching rate limit, wait
-        if self.request_count >= self.max_requests_per_minute:
-            wait_time = 60 - (time.time() - self.request_window_start)
-            if wait_time > 0:
-                logger.warning(f"Rate limit approaching, waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
-                self.request_count = 1
-                self.request_window_start = time.time()
+        """
+        Handle rate limiting for API requests.
+
+        Uses a token bucket that refills continuously at
+        max_requests_per_minute / 60 tokens per second, so requests are
+        spread evenly instead of bursting and then stalling for the rest
+        of a fixed window. A caller that finds the bucket empty reserves
+        its token and sleeps outside the lock, so concurrent callers
+        queue up behind each other rather than all waking at once.
+        """
+        rate_per_second = self.max_requests_per_minute / 60.0
+
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.max_requests_per_minute),
+                self._tokens + (now - self._last_refill) * rate_per_second
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait_time = -self._tokens / rate_per_second if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
 
     def _make_request(
         self,
@@ -133,24 +195,45 @@ class ZuperAPIClient:
         logger.info(f"API Request: {method} {url}")
         logger.info(f"Params: {params}")
 
+        # Revalidate GETs we have seen before instead of re-downloading them
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = (url, frozenset((k, repr(v)) for k, v in (params or {}).items()))
+            with self._conditional_cache_lock:
+                cached = self._conditional_cache.get(cache_key)
+                if cached:
+                    self._conditional_cache.move_to_end(cache_key)
+
         for attempt in range(retry_count):
             try:
-                response = self.session.request(
+                prepared = self.session.prepare_request(requests.Request(
                     method=method,
                     url=url,
                     params=params,
                     json=json_data,
-                    timeout=30
+                    headers=cached[0] if cached else None
+                ))
+                response = self.session.send(
+                    prepared,
+                    timeout=AppSettings.API_TIMEOUT_SECONDS,
+                    **self._send_settings
                 )
 
                 logger.info(f"Response status: {response.status_code}")
 
                 # Handle different HTTP status codes
                 if response.status_code == 200:
-                    json_response = response.json()
+                    json_response = _parse_json(response)
                     logger.info(f"Response type: {json_response.get('type', 'unknown')}")
+                    if cache_key is not None:
+                        self._store_conditional(cache_key, response, json_response)
                     return json_response
 
+                elif response.status_code == 304 and cached:
+                    logger.info("Not modified, reusing cached response")
+                    return cached[1]
+
                 elif response.status_code == 401:
                     raise ZuperAuthenticationError("Invalid API key or authentication failed")
 
@@ -165,7 +248,7 @@ class ZuperAPIClient:
                     continue
 
                 elif response.status_code == 400:
-                    error_msg = response.json().get('message', 'Validation error')
+                    error_msg = _parse_json(response).get('message', 'Validation error')
                     raise ZuperValidationError(f"Validation error: {error_msg}")
 
                 elif 500 <= response.status_code < 600:
@@ -198,6 +281,34 @@ class ZuperAPIClient:
 
         raise ZuperAPIError("Max retries exceeded")
 
+    def _store_conditional(self, cache_key: Tuple, response: requests.Response, json_response: Any):
+        """
+        Remember a GET response's validators so the next identical request
+        can be sent conditionally.
+
+        At most MAX_CONDITIONAL_CACHE_ENTRIES responses are kept; the least
+        recently used one is dropped to make room.
+
+        Args:
+            cache_key: (url, params) key for the request
+            response: HTTP response carrying ETag / Last-Modified headers
+            json_response: Parsed body to return on a 304
+        """
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        with self._conditional_cache_lock:
+            if validators:
+                self._conditional_cache[cache_key] = (validators, json_response)
+                self._conditional_cache.move_to_end(cache_key)
+                while len(self._conditional_cache) > self.MAX_CONDITIONAL_CACHE_ENTRIES:
+                    self._conditional_cache.popitem(last=False)
+            else:
+                self._conditional_cache.pop(cache_key, None)
+
     def get_jobs(
         self,
         page: int = 1,
@@ -245,114 +356,238 @@ class ZuperAPIClient:
 
         return self._make_request("GET", endpoint)
 
+    def iter_parts_jobs_pages(self, failed_pages: Optional[List[int]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield "Field Requires Parts" jobs one API page at a time.
+
+        Page 1 is fetched first to learn total_pages; the remaining pages
+        are fetched concurrently, at most MAX_PAGE_WORKERS ahead of the
+        consumer, and yielded in page order. Only a bounded window of
+        pages, plus at most MAX_CONDITIONAL_CACHE_ENTRIES cached responses,
+        is held in memory regardless of tenant size.
+
+        A page after page 1 that fails is skipped and the later pages are
+        still fetched, so the result can have gaps.
+
+        Args:
+            failed_pages: List to append the numbers of skipped pages to
+
+        Yields:
+            List of parts jobs from each page
+        """
+        page_size = 100
+        matched = 0
+
+        logger.info("Starting to fetch all jobs from Zuper API")
+
+        try:
+            # First fetch all jobs, then filter by category client-side
+            response = self.get_jobs(page=1, page_size=page_size, filters=None)
+        except ZuperAPIError as e:
+            logger.error(f"Error fetching jobs on page 1: {e}")
+            return
+
+        # Handle Zuper API response format - jobs are in 'data' array
+        jobs = response.get("data", [])
+
+        # Log response structure for debugging
+        logger.info(f"Response keys: {list(response.keys())}")
+        if jobs and len(jobs) > 0:
+            logger.info(f"Sample job keys: {list(jobs[0].keys()) if isinstance(jobs[0], dict) else 'not a dict'}")
+
+        if not jobs:
+            logger.info("No jobs in response")
+            return
+
+        parts_jobs = self._filter_parts_jobs(jobs)
+        matched += len(parts_jobs)
+        self._log_page(response, 1, jobs, matched)
+        yield parts_jobs
+
+        # Check if there are more pages - Zuper uses total_records, total_pages
+        total_pages = response.get("total_pages", 1)
+
+        if len(jobs) >= page_size and total_pages > 1:
+            remaining_pages = iter(range(2, total_pages + 1))
+            window = min(self.MAX_PAGE_WORKERS, total_pages - 1)
+
+            with ThreadPoolExecutor(max_workers=window) as executor:
+                pending = deque(
+                    (page, executor.submit(self.get_jobs, page=page, page_size=page_size, filters=None))
+                    for page in islice(remaining_pages, window)
+                )
+
+                try:
+                    # Consume in page order so results match a sequential fetch
+                    while pending:
+                        page, future = pending.popleft()
+
+                        next_page = next(remaining_pages, None)
+                        if next_page is not None:
+                            pending.append((
+                                next_page,
+                                executor.submit(self.get_jobs, page=next_page, page_size=page_size, filters=None)
+                            ))
+
+                        try:
+                            response = future.result()
+                        except ZuperAPIError as e:
+                            logger.error(f"Error fetching jobs on page {page}: {e}")
+                            if failed_pages is not None:
+                                failed_pages.append(page)
+                            continue
+
+                        jobs = response.get("data", [])
+                        parts_jobs = self._filter_parts_jobs(jobs)
+                        matched += len(parts_jobs)
+                        self._log_page(response, page, jobs, matched)
+                        yield parts_jobs
+                finally:
+                    # Consumer stopped early: don't fetch pages nobody will read
+                    for _, future in pending:
+                        future.cancel()
+
+        logger.info(f"Fetched total of {matched} Field Requires Parts jobs")
+
     def get_all_parts_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all jobs with category "Field Requires Parts".
-        Handles pagination automatically.
+
+        Materializes iter_parts_jobs_pages() for callers that need the
+        whole list at once.
 
         Returns:
             List of all parts jobs
         """
-        all_jobs = []
-        page = 1
-        page_size = 100
+        return list(chain.from_iterable(self.iter_parts_jobs_pages()))
 
-        logger.info("Starting to fetch all jobs from Zuper API")
-
-        while True:
-            try:
-                # First fetch all jobs, then filter by category client-side
-                response = self.get_jobs(page=page, page_size=page_size, filters=None)
+    @staticmethod
+    def _filter_parts_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep only jobs in the "Field Requires Parts" category.
 
-                # Handle Zuper API response format - jobs are in 'data' array
-                jobs = response.get("data", [])
+        Args:
+            jobs: Jobs from one page of the API response
 
-                # Log response structure for debugging
-                logger.info(f"Response keys: {list(response.keys())}")
-                if jobs and len(jobs) > 0:
-                    logger.info(f"Sample job keys: {list(jobs[0].keys()) if isinstance(jobs[0], dict) else 'not a dict'}")
+        Returns:
+            List of parts jobs
+        """
+        parts_jobs = []
+        for job in jobs:
+            job_category = job.get("job_category", {})
+            if isinstance(job_category, dict):
+                category_name = job_category.get("name") or job_category.get("category_name", "")
+            else:
+                category_name = str(job_category) if job_category else ""
 
-                if not jobs:
-                    logger.info("No jobs in response")
-                    break
+            if "Field Requires Parts" in category_name or "Parts" in category_name:
+                parts_jobs.append(job)
 
-                # Filter for "Field Requires Parts" category
-                for job in jobs:
-                    job_category = job.get("job_category", {})
-                    if isinstance(job_category, dict):
-                        category_name = job_category.get("name") or job_category.get("category_name", "")
-                    else:
-                        category_name = str(job_category) if job_category else ""
+        return parts_jobs
 
-                    if "Field Requires Parts" in category_name or "Parts" in category_name:
-                        all_jobs.append(job)
+    @staticmethod
+    def _log_page(response: Dict[str, Any], page: int, jobs: List[Dict[str, Any]], matched: int):
+        """Log pagination progress for a fetched page."""
+        total_records = response.get("total_records", len(jobs))
+        total_pages = response.get("total_pages", 1)
+        current_page = response.get("current_page", page)
 
-                # Check if there are more pages - Zuper uses total_records, total_pages
-                total_records = response.get("total_records", len(jobs))
-                total_pages = response.get("total_pages", 1)
-                current_page = response.get("current_page", page)
+        logger.info(f"Fetched page {current_page}/{total_pages}, got {len(jobs)} jobs (total: {total_records}), matched {matched} parts jobs so far")
 
-                logger.info(f"Fetched page {current_page}/{total_pages}, got {len(jobs)} jobs (total: {total_records}), matched {len(all_jobs)} parts jobs so far")
+    def iter_eu_parts_jobs_pages(self, failed_pages: Optional[List[int]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield EU parts jobs (within geographic bounds) one API page at a time.
+        Filters for:
+        - Category: "Field Requires Parts"
+        - Location: Europe (35-72°N, -11 to 40°E)
 
-                if len(jobs) < page_size or page >= total_pages:
-                    break
+        The jobs endpoint has no geographic filter, so the bounds check
+        runs client-side.
 
-                page += 1
+        Args:
+            failed_pages: List to append the numbers of skipped pages to;
+                see iter_parts_jobs_pages
 
-            except ZuperAPIError as e:
-                logger.error(f"Error fetching jobs on page {page}: {e}")
-                break
+        Yields:
+            List of EU parts jobs from each page
+        """
+        total = 0
+        eu_total = 0
 
-        logger.info(f"Fetched total of {len(all_jobs)} Field Requires Parts jobs")
+        for parts_jobs in self.iter_parts_jobs_pages(failed_pages):
+            eu_jobs = self._filter_eu_jobs(parts_jobs)
+            total += len(parts_jobs)
+            eu_total += len(eu_jobs)
+            yield eu_jobs
 
-        return all_jobs
+        logger.info(f"Filtered to {eu_total} EU parts jobs from {total} total")
 
     def get_eu_parts_jobs(self) -> List[Dict[str, Any]]:
         """
         Fetch all EU parts jobs (within geographic bounds).
-        Filters for:
-        - Category: "Field Requires Parts"
-        - Location: Europe (35-72°N, -11 to 40°E)
+
+        Materializes iter_eu_parts_jobs_pages() for callers that need the
+        whole list at once.
 
         Returns:
             List of EU parts jobs
         """
-        all_parts_jobs = self.get_all_parts_jobs()
+        return list(chain.from_iterable(self.iter_eu_parts_jobs_pages()))
 
-        # Filter by EU geographic bounds
-        eu_jobs = []
-        for job in all_parts_jobs:
-            # Zuper uses customer_address.geo_cordinates as array [lat, lng]
-            location = job.get("customer_address", {}) or {}
-            geo_coords = location.get("geo_cordinates", [])
+    @classmethod
+    def _filter_eu_jobs(cls, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep only jobs whose location falls within the EU bounds.
+
+        Args:
+            jobs: Parts jobs to filter
+
+        Returns:
+            List of EU parts jobs
+        """
+        # Filter by EU geographic bounds in one vectorized pass;
+        # missing coordinates are NaN and fail every comparison.
+        # Coordinates stream straight into a flat float buffer, with no
+        # intermediate list of tuples.
+        coords = np.fromiter(
+            chain.from_iterable(cls._job_coordinates(job) for job in jobs),
+            dtype=np.float64,
+            count=2 * len(jobs)
+        ).reshape(-1, 2)
+        lats, lons = coords[:, 0], coords[:, 1]
+
+        in_bounds = (lats >= 35) & (lats <= 72) & (lons >= -11) & (lons <= 40)
+
+        missing = int(np.count_nonzero(np.isnan(lats) | np.isnan(lons)))
+        if missing:
+            logger.debug(f"{missing} parts jobs have no location data")
+
+        return [jobs[i] for i in np.flatnonzero(in_bounds)]
+
+    @staticmethod
+    def _job_coordinates(job: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Extract (latitude, longitude) from a job, NaN where unavailable.
 
-            lat, lon = None, None
+        Args:
+            job: Job data from Zuper API
 
-            # geo_cordinates is an array of numbers [lat, lng]
-            if isinstance(geo_coords, list) and len(geo_coords) >= 2:
-                lat = geo_coords[0]
-                lon = geo_coords[1]
+        Returns:
+            Tuple of (latitude, longitude)
+        """
+        # Zuper uses customer_address.geo_cordinates as array [lat, lng]
+        location = job.get("customer_address", {}) or {}
+        geo_coords = location.get("geo_cordinates", [])
 
-            # Convert to float if needed
+        if isinstance(geo_coords, list) and len(geo_coords) >= 2:
             try:
-                if lat is not None:
-                    lat = float(lat)
-                if lon is not None:
-                    lon = float(lon)
+                lat = float(geo_coords[0]) if geo_coords[0] is not None else math.nan
+                lon = float(geo_coords[1]) if geo_coords[1] is not None else math.nan
+                return (lat, lon)
             except (ValueError, TypeError):
-                lat, lon = None, None
-
-            if lat is not None and lon is not None:
-                # Check if within EU bounds
-                if 35 <= lat <= 72 and -11 <= lon <= 40:
-                    eu_jobs.append(job)
-            else:
-                # Include jobs without coordinates (can't filter by location)
-                logger.debug(f"Job {job.get('job_uid', 'unknown')} has no location data")
-
-        logger.info(f"Filtered to {len(eu_jobs)} EU parts jobs from {len(all_parts_jobs)} total")
+                pass
 
-        return eu_jobs
+        return (math.nan, math.nan)
 
     def test_connection(self) -> bool:
         """
@@ -8,7 +8,9 @@ NO update functionality - data is read-only.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import logging
+import time
 from datetime import datetime
 
 # Configure logging
@@ -22,8 +24,6 @@ logger = logging.getLogger(__name__)
 from database.queries import JobQueries
 from database.connection import is_database_configured, DatabaseNotConfiguredError
 from components.job_card import render_job_card, render_job_list
-from components.bulk_lookup import render_bulk_lookup
-from components.parts_inventory import render_parts_inventory
 from components.ai_assistant import (
     is_ai_available,
     render_ai_search_bar,
@@ -34,8 +34,8 @@ from components.ai_assistant import (
 from src.zuper_api.client import get_zuper_client, is_zuper_configured, ZuperAPINotConfiguredError
 from src.sync.sync_manager import SyncManager
 from utils.language import Language
-from utils.formatters import format_datetime, format_status, status_badge
-from utils.gps_helpers import format_map_data, get_center_point
+from utils.formatters import format_datetime, status_badge, format_datetime_column, format_status_column
+from utils.export import df_to_csv, df_to_json, df_to_parquet, PYARROW_AVAILABLE
 from config.settings import AppSettings, FeatureFlags
 
 # Database is automatically initialized when first connection is made
@@ -50,109 +50,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for improved dashboard styling
+# Custom CSS for improved dashboard styling. Re-sent on every rerun:
+# Streamlit drops elements a run doesn't emit, so it can't be sent once.
+# Status tile colors are emitted by render_status_tiles.
 st.markdown("""
 <style>
-/* Status tiles - centered content */
-.status-tile {
-    padding: 20px 16px;
-    border-radius: 14px;
-    text-align: center;
-    margin: 6px 4px;
-    cursor: pointer;
-    transition: all 0.2s ease;
-    box-shadow: 0 3px 6px rgba(0,0,0,0.12);
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    justify-content: center;
-    min-height: 140px;
-}
-.status-tile:hover {
-    transform: translateY(-3px);
-    box-shadow: 0 6px 12px rgba(0,0,0,0.18);
-}
-.status-tile .icon {
-    font-size: 28px;
-    margin-bottom: 10px;
-    line-height: 1;
-    display: block;
-}
-.status-tile h3 {
-    margin: 0;
-    padding: 0;
-    font-size: 15px;
-    font-weight: 700;
-    color: white;
-    text-transform: uppercase;
-    letter-spacing: 1.5px;
-    line-height: 1;
-    display: block;
-}
-.status-tile p {
-    margin: 12px 0 0 0;
-    padding: 0;
-    font-size: 42px;
-    font-weight: 800;
-    color: white;
-    line-height: 1;
-    display: block;
-}
-
-/* Status tile colors - clearer progression */
-.tile-all { background: linear-gradient(135deg, #546E7A, #607D8B); }
-.tile-new { background: linear-gradient(135deg, #1976D2, #2196F3); }
-.tile-received { background: linear-gradient(135deg, #7B1FA2, #9C27B0); }
-.tile-ordered { background: linear-gradient(135deg, #F57C00, #FF9800); }
-.tile-pickup { background: linear-gradient(135deg, #00838F, #00ACC1); }
-.tile-shipped { background: linear-gradient(135deg, #00796B, #009688); }
-.tile-delivered { background: linear-gradient(135deg, #388E3C, #4CAF50); }
-.tile-done { background: linear-gradient(135deg, #2E7D32, #43A047); }
-.tile-canceled { background: linear-gradient(135deg, #757575, #9E9E9E); }
-
-.tile-selected {
-    box-shadow: 0 0 0 3px #fff, 0 0 0 5px #1a1a1a !important;
-    transform: translateY(-2px) scale(1.02);
-}
-
-/* Hide the Select button text and make it overlay the tile */
-.tile-button button {
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    opacity: 0;
-    cursor: pointer;
-}
-.tile-button {
-    position: relative;
-}
-.tile-button > div:first-child {
-    position: relative;
-}
-.tile-button > div:last-child button {
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    width: 100%;
-    height: 160px;
-    margin-top: -160px;
-    opacity: 0;
-    cursor: pointer;
-}
-
-/* Job cards - cleaner look */
-.job-card {
-    background: #f8f9fa;
-    border-radius: 8px;
-    padding: 16px;
-    margin: 8px 0;
-    border-left: 4px solid #2196F3;
-}
-
 /* Better table styling */
 .dataframe {
     font-size: 14px !important;
@@ -166,6 +68,215 @@ section[data-testid="stSidebar"] {
 """, unsafe_allow_html=True)
 
 
+# Status tile configuration: (display_label, api_status, icon, background)
+# Using simple labels with icons for clarity
+_TILE_CONFIG = (
+    ("All", "All", "📋", "linear-gradient(135deg, #546E7A, #607D8B)"),
+    ("New", "New Ticket", "🆕", "linear-gradient(135deg, #1976D2, #2196F3)"),
+    ("Received Request", "Received Request", "📥", "linear-gradient(135deg, #7B1FA2, #9C27B0)"),
+    ("Ordered", "Parts On Order", "🛒", "linear-gradient(135deg, #F57C00, #FF9800)"),
+    ("Pickup", "Shop Pick UP", "🏪", "linear-gradient(135deg, #00838F, #00ACC1)"),
+    ("Shipped", "Shipped", "📦", "linear-gradient(135deg, #00796B, #009688)"),
+    ("Delivered", "Parts delivered", "✅", "linear-gradient(135deg, #388E3C, #4CAF50)"),
+    ("Done", "Done", "🎉", "linear-gradient(135deg, #2E7D32, #43A047)"),
+    ("Canceled", "Canceled", "⊘", "linear-gradient(135deg, #757575, #9E9E9E)"),
+)
+
+_TILE_SELECTED_STYLE = """
+                .st-key-status_tiles button[data-testid$="Active"] {
+                    box-shadow: 0 0 0 3px #fff, 0 0 0 5px #1a1a1a !important;
+                    transform: scale(1.02);
+                }
+"""
+
+# Pre-lowercased haystacks added by _load_jobs_df for the text filters;
+# internal only, so dropped before export or handing jobs to the AI
+_SEARCH_BLOB_COLUMNS = ["_search_blob", "_ai_text_blob"]
+_BLOB_SEPARATOR = "\x1f"  # Unit separator: can't be typed, so matches never span fields
+
+# Job cards are heavier to render than table rows, so they page in smaller steps
+_CARDS_PER_PAGE = 20
+
+# Low-cardinality columns stored as category dtype so tile counts and
+# status/priority filters compare integer codes rather than strings.
+# Known values come first, in workflow/severity order, so sorting follows
+# that order; values Zuper sends that aren't listed are appended.
+_CATEGORICAL_COLUMNS = {
+    "job_status": AppSettings.JOB_STATUSES,
+    "priority": AppSettings.PRIORITY_LEVELS,
+    "parts_status": [],
+    "customer_name": [],
+}
+
+@st.cache_data(ttl=AppSettings.CACHE_TTL_SHORT, show_spinner=False)
+def _load_jobs_df() -> pd.DataFrame:
+    """
+    Load all EU parts jobs, cached across reruns and sessions.
+    Cleared after each sync so new data shows immediately.
+
+    The searched text columns are joined and lowercased once here, so a
+    search is a single literal contains() per rerun instead of a
+    lower() + contains() pass per column, and the status-like columns
+    are converted to categoricals.
+
+    Returns:
+        DataFrame with all EU parts jobs
+    """
+    df = JobQueries.get_eu_parts_jobs_for_dashboard()
+    if df.empty:
+        return df
+
+    df['_search_blob'] = (
+        df['job_number'].fillna('') + _BLOB_SEPARATOR
+        + df['title'].fillna('') + _BLOB_SEPARATOR
+        + df['customer_name'].fillna('')
+    ).str.lower()
+    df['_ai_text_blob'] = (
+        df['title'].fillna('') + _BLOB_SEPARATOR
+        + df['description'].fillna('')
+    ).str.lower()
+
+    # pandas 3 already stores strings in Arrow buffers; on pandas 2 the
+    # blobs would be object columns, so convert them for Arrow's substring kernel
+    for column in _SEARCH_BLOB_COLUMNS:
+        if pd.api.types.is_object_dtype(df[column]):
+            df[column] = df[column].astype("string[pyarrow]")
+
+    for column, known_values in _CATEGORICAL_COLUMNS.items():
+        df[column] = df[column].astype(_category_dtype(df[column], known_values))
+
+    return df
+
+
+def _category_dtype(values: pd.Series, known_values: list) -> pd.CategoricalDtype:
+    """
+    Build a categorical dtype from the known values plus any others present.
+
+    Args:
+        values: Column to be converted
+        known_values: Expected values, in display order
+
+    Returns:
+        CategoricalDtype covering every value in the column
+    """
+    extra_values = sorted(set(values.dropna().unique()) - set(known_values))
+    return pd.CategoricalDtype(categories=list(known_values) + extra_values)
+
+
+@st.cache_resource
+def _jobs_data_generation() -> dict:
+    """
+    Process-wide counter bumped after every sync.
+    Lets each session notice that its stored DataFrame is out of date.
+
+    Returns:
+        Mutable dict holding the current generation under "value"
+    """
+    return {"value": 0}
+
+
+def _get_jobs_df() -> pd.DataFrame:
+    """
+    Get the jobs DataFrame for this session.
+
+    The frame is kept in session_state, so reruns and page switches reuse
+    the same object instead of unpickling a fresh copy from the
+    st.cache_data store. It is reloaded after CACHE_TTL_SHORT or as soon
+    as any session completes a sync.
+
+    Returns:
+        DataFrame with all EU parts jobs
+    """
+    generation = _jobs_data_generation()["value"]
+    state = st.session_state
+
+    if (
+        state.jobs_df is None
+        or state.jobs_df_generation != generation
+        or time.monotonic() - state.jobs_df_loaded_at > AppSettings.CACHE_TTL_SHORT
+    ):
+        state.jobs_df = _load_jobs_df()
+        state.jobs_status_counts = _count_statuses(state.jobs_df)
+        state.jobs_df_loaded_at = time.monotonic()
+        state.jobs_df_updated_text = format_datetime(datetime.now())
+        state.jobs_df_generation = generation
+
+    return state.jobs_df
+
+
+def _count_statuses(jobs_df: pd.DataFrame) -> dict:
+    """
+    Count jobs per status for the status tiles.
+    Done once per load, so tile rendering is only dict lookups.
+
+    Args:
+        jobs_df: DataFrame with job data
+
+    Returns:
+        Dictionary mapping job status to job count
+    """
+    if jobs_df.empty:
+        return {}
+    # Tiles have a fixed order, so skip sorting by count. Categorical
+    # counts list every known status; keep only those present
+    counts = jobs_df['job_status'].value_counts(sort=False)
+    return counts[counts > 0].to_dict()
+
+
+def _invalidate_jobs_data():
+    """Drop cached job data everywhere after a sync."""
+    from components.parts_inventory import load_parts_jobs
+
+    _load_jobs_df.clear()
+    load_parts_jobs.clear()
+    _lookup_job.clear()
+    _load_last_sync_info.clear()
+    _jobs_data_generation()["value"] += 1
+
+
+def _without_search_blobs(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the internal search columns added by _load_jobs_df."""
+    return jobs_df.drop(columns=_SEARCH_BLOB_COLUMNS, errors='ignore')
+
+
+@st.cache_resource(ttl=AppSettings.CACHE_TTL_VERY_SHORT, show_spinner=False)
+def _zuper_configured() -> bool:
+    """
+    Check whether Zuper API secrets are configured, cached briefly.
+    The sidebar and sync page ask on every rerun; the short TTL still
+    picks up secrets added while the app is running.
+
+    Returns:
+        True if the Zuper API secrets are present
+    """
+    return is_zuper_configured()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_sync_manager() -> SyncManager:
+    """
+    Get the shared SyncManager and its Zuper client.
+    Cached as a Streamlit resource so the client's HTTP session and
+    connection pool are built once, not on every rerun.
+
+    Returns:
+        SyncManager instance
+    """
+    return SyncManager(get_zuper_client())
+
+
+@st.cache_data(ttl=AppSettings.CACHE_TTL_VERY_SHORT, show_spinner=False)
+def _load_last_sync_info():
+    """
+    Load the last sync_log entry for the sidebar, cached briefly.
+
+    Returns:
+        Dictionary with last sync info or None
+    """
+    # Only reads sync_log, so the Zuper client isn't built just for the sidebar
+    return SyncManager.get_last_sync_info()
+
+
 def initialize_session_state():
     """Initialize session state variables."""
     if 'language' not in st.session_state:
@@ -176,6 +287,14 @@ def initialize_session_state():
         st.session_state.last_sync = None
     if 'status_filter' not in st.session_state:
         st.session_state.status_filter = "All"
+    if 'jobs_page' not in st.session_state:
+        st.session_state.jobs_page = 0
+    if 'jobs_df' not in st.session_state:
+        st.session_state.jobs_df = None
+        st.session_state.jobs_status_counts = {}
+        st.session_state.jobs_df_loaded_at = 0.0
+        st.session_state.jobs_df_updated_text = format_datetime(datetime.now())
+        st.session_state.jobs_df_generation = -1
 
 
 def render_sidebar():
@@ -187,17 +306,17 @@ def render_sidebar():
         lang = Language(st.session_state.language)
         languages = lang.get_available_languages()
 
-        selected_lang = st.selectbox(
+        # The callback switches language before this run renders anything,
+        # so a change doesn't need a second st.rerun() pass
+        st.selectbox(
             "Language / Taal",
             options=list(languages.keys()),
-            format_func=lambda x: languages[x],
-            index=list(languages.keys()).index(st.session_state.language)
+            format_func=languages.get,
+            index=list(languages.keys()).index(st.session_state.language),
+            key="language_select",
+            on_change=_set_language
         )
 
-        if selected_lang != st.session_state.language:
-            st.session_state.language = selected_lang
-            st.rerun()
-
         st.divider()
 
         # Navigation
@@ -234,18 +353,21 @@ def render_sidebar():
         return pages[selected_page], lang
 
 
+def _set_language():
+    """Language selectbox callback: switch the UI language."""
+    st.session_state.language = st.session_state.language_select
+
+
 def render_sync_info(lang: Language):
     """Render sync information in sidebar."""
     st.subheader(lang.get("last_sync"))
 
-    if not is_zuper_configured():
+    if not _zuper_configured():
         st.info("API not configured")
         return
 
     try:
-        api_client = get_zuper_client()
-        sync_manager = SyncManager(api_client)
-        last_sync = sync_manager.get_last_sync_info()
+        last_sync = _load_last_sync_info()
 
         if last_sync:
             sync_time = last_sync.get('sync_completed') or last_sync.get('sync_started')
@@ -269,94 +391,85 @@ def render_sync_info(lang: Language):
         st.info("No sync data")
 
 
-def render_status_tiles(jobs_df: pd.DataFrame):
+def render_status_tiles(jobs_df: pd.DataFrame, status_counts: dict):
     """
     Render clickable status tiles for filtering.
     Uses icons and simple labels for better UX.
+
+    Args:
+        jobs_df: DataFrame with job data
+        status_counts: Job count per status, precomputed when the data loads
     """
-    # Get status counts
-    status_counts = jobs_df['job_status'].value_counts().to_dict()
     total_jobs = len(jobs_df)
+    if total_jobs == 0:
+        return
 
-    # Status configuration: (display_label, api_status, icon, css_class)
-    # Using simple labels with icons for clarity
-    statuses = [
-        ("All", "All", "📋", "tile-all", total_jobs),
-        ("New", "New Ticket", "🆕", "tile-new", status_counts.get("New Ticket", 0)),
-        ("Received Request", "Received Request", "📥", "tile-received", status_counts.get("Received Request", 0)),
-        ("Ordered", "Parts On Order", "🛒", "tile-ordered", status_counts.get("Parts On Order", 0)),
-        ("Pickup", "Shop Pick UP", "🏪", "tile-pickup", status_counts.get("Shop Pick UP", 0)),
-        ("Shipped", "Shipped", "📦", "tile-shipped", status_counts.get("Shipped", 0)),
-        ("Delivered", "Parts delivered", "✅", "tile-delivered", status_counts.get("Parts delivered", 0)),
-        ("Done", "Done", "🎉", "tile-done", status_counts.get("Done", 0)),
-        ("Canceled", "Canceled", "⊘", "tile-canceled", status_counts.get("Canceled", 0)),
-    ]
+    present_statuses = {status for status, count in status_counts.items() if count > 0}
 
-    # Display in 2 rows for better readability
-    # Row 1: All, New, Received, Ordered, Pickup
-    row1 = statuses[:5]
-    cols1 = st.columns(5)
-    for idx, (label, api_status, icon, css_class, count) in enumerate(row1):
-        with cols1[idx]:
-            is_selected = st.session_state.status_filter == api_status
-            selected_class = "tile-selected" if is_selected else ""
-            # Clickable tile - button overlays the tile
-            if st.button(f"{icon}\n{label}\n{count}", key=f"tile_{api_status}", use_container_width=True, type="secondary"):
-                st.session_state.status_filter = api_status
-                st.rerun()
-            # Visual tile overlay
-            st.markdown(f"""
-                <style>
-                div[data-testid="stButton"]:has(button[key="tile_{api_status}"]) button {{
-                    background: {'linear-gradient(135deg, #546E7A, #607D8B)' if css_class == 'tile-all' else
-                                'linear-gradient(135deg, #1976D2, #2196F3)' if css_class == 'tile-new' else
-                                'linear-gradient(135deg, #7B1FA2, #9C27B0)' if css_class == 'tile-received' else
-                                'linear-gradient(135deg, #F57C00, #FF9800)' if css_class == 'tile-ordered' else
-                                'linear-gradient(135deg, #00838F, #00ACC1)' if css_class == 'tile-pickup' else
-                                'linear-gradient(135deg, #00796B, #009688)' if css_class == 'tile-shipped' else
-                                'linear-gradient(135deg, #388E3C, #4CAF50)' if css_class == 'tile-delivered' else
-                                'linear-gradient(135deg, #2E7D32, #43A047)' if css_class == 'tile-done' else
-                                'linear-gradient(135deg, #757575, #9E9E9E)'} !important;
-                    color: white !important;
-                    border: none !important;
-                    min-height: 140px !important;
-                    font-size: 14px !important;
-                    font-weight: 700 !important;
-                    white-space: pre-line !important;
-                    {'box-shadow: 0 0 0 3px #fff, 0 0 0 5px #1a1a1a !important; transform: scale(1.02);' if is_selected else ''}
-                }}
-                </style>
-            """, unsafe_allow_html=True)
-
-    # Row 2: Shipped, Delivered, Done, Canceled
-    row2 = statuses[5:]
-    cols2 = st.columns([1, 1, 1, 1, 1])
-    for idx, (label, api_status, icon, css_class, count) in enumerate(row2):
-        with cols2[idx]:
-            is_selected = st.session_state.status_filter == api_status
-            selected_class = "tile-selected" if is_selected else ""
-            # Clickable tile - button overlays the tile
-            if st.button(f"{icon}\n{label}\n{count}", key=f"tile_{api_status}", use_container_width=True, type="secondary"):
-                st.session_state.status_filter = api_status
-                st.rerun()
-            # Visual tile overlay
-            st.markdown(f"""
-                <style>
-                div[data-testid="stButton"]:has(button[key="tile_{api_status}"]) button {{
-                    background: {'linear-gradient(135deg, #00796B, #009688)' if css_class == 'tile-shipped' else
-                                'linear-gradient(135deg, #388E3C, #4CAF50)' if css_class == 'tile-delivered' else
-                                'linear-gradient(135deg, #2E7D32, #43A047)' if css_class == 'tile-done' else
-                                'linear-gradient(135deg, #757575, #9E9E9E)'} !important;
+    if FeatureFlags.ENABLE_COMPACT_STATUS_TILES:
+        # Statuses with no jobs get no tile, unless it's the active filter
+        tiles = [
+            tile for tile in _TILE_CONFIG
+            if tile[1] in ("All", st.session_state.status_filter) or tile[1] in present_statuses
+        ]
+    else:
+        tiles = _TILE_CONFIG
+
+    tile_labels = {
+        api_status: f"{icon} {label} · {total_jobs if api_status == 'All' else status_counts.get(api_status, 0)}"
+        for label, api_status, icon, _ in tiles
+    }
+    if st.session_state.status_filter not in tile_labels:
+        st.session_state.status_filter = "All"
+
+    # All tiles are one segmented control: a single widget instead of a
+    # button and column per status. Its state is seeded from status_filter
+    # so the selection survives switching pages.
+    st.session_state.status_tiles = st.session_state.status_filter
+    st.segmented_control(
+        "Status", options=list(tile_labels), format_func=tile_labels.get,
+        key="status_tiles", on_change=_set_status_filter,
+        label_visibility="collapsed", width="stretch"
+    )
+
+    # Paint the segments as tiles, sent to the browser as one style block
+    tile_styles = "".join(
+        _tile_style(position, gradient)
+        for position, (_, _, _, gradient) in enumerate(tiles, start=1)
+    )
+    st.markdown(
+        f"<style>{tile_styles}{_TILE_SELECTED_STYLE}</style>",
+        unsafe_allow_html=True
+    )
+
+
+def _set_status_filter():
+    """Tile selection callback: filter on the chosen status, "All" when deselected."""
+    st.session_state.status_filter = st.session_state.status_tiles or "All"
+    st.session_state.jobs_page = 0
+
+
+def _tile_style(position: int, gradient: str) -> str:
+    """
+    Build the CSS rule that paints one status tile segment.
+
+    Args:
+        position: 1-based position of the tile in the control
+        gradient: CSS background for the tile
+
+    Returns:
+        CSS rule text
+    """
+    return f"""
+                .st-key-status_tiles button:nth-child({position}) {{
+                    background: {gradient} !important;
                     color: white !important;
                     border: none !important;
-                    min-height: 140px !important;
+                    min-height: 70px !important;
                     font-size: 14px !important;
                     font-weight: 700 !important;
-                    white-space: pre-line !important;
-                    {'box-shadow: 0 0 0 3px #fff, 0 0 0 5px #1a1a1a !important; transform: scale(1.02);' if is_selected else ''}
                 }}
-                </style>
-            """, unsafe_allow_html=True)
+    """
 
 
 def render_configuration_error():
@@ -379,7 +492,7 @@ def render_dashboard_page(lang: Language):
 
     # Load data
     try:
-        jobs_df = JobQueries.get_all_eu_parts_jobs()
+        jobs_df = _get_jobs_df()
     except Exception as e:
         logger.error(f"Error loading jobs: {e}")
         st.error(f"Failed to load data: {str(e)}")
@@ -388,65 +501,78 @@ def render_dashboard_page(lang: Language):
 
     if jobs_df.empty:
         st.warning(lang.get("no_jobs_found"))
-        if is_zuper_configured():
+        if _zuper_configured():
             st.info("Please run a data sync to populate the database.")
         else:
             render_configuration_error()
         return
 
+    render_jobs_section(jobs_df, st.session_state.jobs_status_counts, lang)
+
+
+@st.fragment
+def render_jobs_section(jobs_df: pd.DataFrame, status_counts: dict, lang: Language):
+    """
+    Render status tiles, filters and results for the dashboard.
+
+    Runs as a fragment: clicking a tile or typing in the filters reruns
+    only this section, not the sidebar and the rest of the page.
+    """
     # Display status tiles
-    render_status_tiles(jobs_df)
+    render_status_tiles(jobs_df, status_counts)
 
     st.divider()
 
+    # Every filter ANDs into one row mask; the frame is sliced once at the end.
+    # Cheap categorical filters run first so the substring scans below
+    # only touch rows that are still selected.
+    mask = np.ones(len(jobs_df), dtype=bool)
+
     # Apply status filter
-    filtered_df = jobs_df.copy()
     if st.session_state.status_filter != "All":
-        filtered_df = filtered_df[filtered_df['job_status'] == st.session_state.status_filter]
+        mask &= (jobs_df['job_status'] == st.session_state.status_filter).to_numpy()
 
     # AI Search (if available)
     ai_filters = None
     if FeatureFlags.ENABLE_AI_SEARCH and is_ai_available():
-        customers = jobs_df['customer_name'].dropna().unique().tolist()
+        # Customer names are only collected when an AI search actually runs
         ai_filters = render_ai_search_bar(
             available_statuses=AppSettings.JOB_STATUSES,
             available_priorities=AppSettings.PRIORITY_LEVELS,
-            available_customers=customers
+            available_customers=lambda: jobs_df['customer_name'].dropna().unique().tolist()
         )
 
         if ai_filters:
             # Apply AI-parsed filters
             if ai_filters.get("status"):
-                filtered_df = filtered_df[filtered_df['job_status'].isin(ai_filters["status"])]
+                mask &= jobs_df['job_status'].isin(ai_filters["status"]).to_numpy()
             if ai_filters.get("priority"):
-                filtered_df = filtered_df[filtered_df['priority'].isin(ai_filters["priority"])]
+                mask &= jobs_df['priority'].isin(ai_filters["priority"]).to_numpy()
             if ai_filters.get("customer"):
                 customer_filter = ai_filters["customer"].lower()
-                filtered_df = filtered_df[
-                    filtered_df['customer_name'].str.lower().str.contains(customer_filter, na=False)
-                ]
+                _and_contains(mask, jobs_df['customer_name'], customer_filter, lowercase=True)
             if ai_filters.get("search_text"):
                 search_text = ai_filters["search_text"].lower()
-                filtered_df = filtered_df[
-                    filtered_df['title'].str.lower().str.contains(search_text, na=False) |
-                    filtered_df['description'].str.lower().str.contains(search_text, na=False)
-                ]
+                _and_contains(mask, jobs_df['_ai_text_blob'], search_text)
 
         st.divider()
 
-    # Search box
-    search_term = st.text_input(
-        lang.get("search"),
-        placeholder=lang.get("enter_job_number")
-    )
+    # Search box; inside a form the filter only reruns on Enter or the
+    # button, not when the box merely loses focus mid-edit
+    with st.form("search_form", border=False):
+        search_term = st.text_input(
+            lang.get("search"),
+            placeholder=lang.get("enter_job_number")
+        )
+        st.form_submit_button(lang.get("search"), on_click=_set_jobs_page, args=(0,))
 
     if search_term:
         search_lower = search_term.lower()
-        filtered_df = filtered_df[
-            filtered_df['job_number'].str.lower().str.contains(search_lower, na=False) |
-            filtered_df['title'].str.lower().str.contains(search_lower, na=False) |
-            filtered_df['customer_name'].str.lower().str.contains(search_lower, na=False)
-        ]
+        _and_contains(mask, jobs_df['_search_blob'], search_lower)
+
+    # With no active filter, use the loaded frame as is rather than
+    # copying every row through a boolean index
+    filtered_df = jobs_df if mask.all() else jobs_df[mask]
 
     st.divider()
 
@@ -466,17 +592,26 @@ def render_dashboard_page(lang: Language):
         if FeatureFlags.ENABLE_MAP_VIEW:
             show_map = st.checkbox(lang.get("show_map"))
 
-    # Map view
-    if FeatureFlags.ENABLE_MAP_VIEW and show_map:
+    # Map view; show_map stays False when the map flag is off
+    if show_map:
         render_map_view(filtered_df, lang)
 
     st.divider()
 
-    # Display jobs
+    # Display jobs one page at a time, so each rerun only formats and
+    # sends a page of rows to the browser
+    if view_mode == "Table":
+        page_size = AppSettings.get_max_jobs_per_page()
+    else:
+        page_size = _CARDS_PER_PAGE
+    page_df = _current_page(filtered_df, page_size)
+
     if view_mode == "Table":
-        render_jobs_table(filtered_df, lang)
+        render_jobs_table(page_df, lang)
     else:
-        render_job_list(filtered_df, max_items=20)
+        render_job_list(page_df, max_items=page_size, total=len(filtered_df))
+
+    render_page_controls(len(filtered_df), page_size)
 
     # Export
     if FeatureFlags.ENABLE_EXPORT:
@@ -484,6 +619,86 @@ def render_dashboard_page(lang: Language):
         render_export_options(filtered_df, lang)
 
 
+def _current_page(jobs_df: pd.DataFrame, page_size: int) -> pd.DataFrame:
+    """
+    Slice out the rows for the current results page.
+    The stored page number is clamped, since filters can shrink the results.
+
+    Args:
+        jobs_df: Filtered jobs
+        page_size: Rows per page
+
+    Returns:
+        DataFrame with the current page's rows
+    """
+    page_count = max(1, -(-len(jobs_df) // page_size))
+    page = min(st.session_state.jobs_page, page_count - 1)
+    st.session_state.jobs_page = page
+    return jobs_df.iloc[page * page_size:(page + 1) * page_size]
+
+
+def render_page_controls(total_jobs: int, page_size: int):
+    """
+    Render previous/next buttons for the results pages.
+
+    Args:
+        total_jobs: Number of filtered jobs
+        page_size: Rows per page
+    """
+    page_count = -(-total_jobs // page_size)
+    if page_count <= 1:
+        return
+
+    page = st.session_state.jobs_page
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button(
+            "Previous", key="jobs_page_prev", disabled=page == 0,
+            on_click=_set_jobs_page, args=(page - 1,)
+        )
+    with col2:
+        first = page * page_size + 1
+        last = min((page + 1) * page_size, total_jobs)
+        st.caption(f"Page {page + 1} of {page_count} ({first}-{last} of {total_jobs})")
+    with col3:
+        st.button(
+            "Next", key="jobs_page_next", disabled=page >= page_count - 1,
+            on_click=_set_jobs_page, args=(page + 1,)
+        )
+
+
+def _set_jobs_page(page: int):
+    """Page button callback: show the given results page."""
+    st.session_state.jobs_page = page
+
+
+def _and_contains(mask: np.ndarray, values: pd.Series, needle: str, lowercase: bool = False):
+    """
+    AND a literal substring match into a row mask, in place.
+
+    Only rows the mask still selects are scanned, so a narrow status
+    filter makes the string search proportionally cheaper.
+
+    Args:
+        mask: Boolean row mask over values, updated in place
+        values: String column to search
+        needle: Substring to look for (already lowercased)
+        lowercase: Match case-insensitively against a column that is not
+            pre-lowercased; meant for low-cardinality columns, since each
+            distinct value is lowercased once instead of every row
+    """
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
+        return
+
+    candidates = values.iloc[rows]
+    if lowercase:
+        matching = [value for value in candidates.dropna().unique() if needle in value.lower()]
+        mask[rows] = candidates.isin(matching).to_numpy(dtype=bool)
+        return
+    mask[rows] = candidates.str.contains(needle, na=False, regex=False).to_numpy(dtype=bool)
+
+
 def render_jobs_table(jobs_df: pd.DataFrame, lang: Language):
     """Render jobs as a table."""
     display_columns = [
@@ -491,52 +706,77 @@ def render_jobs_table(jobs_df: pd.DataFrame, lang: Language):
         'scheduled_start_time', 'priority', 'parts_status'
     ]
 
-    display_df = jobs_df[display_columns].copy()
-
-    display_df['scheduled_start_time'] = display_df['scheduled_start_time'].apply(
-        lambda x: format_datetime(x) if pd.notna(x) else 'N/A'
+    # Dates are formatted here so missing ones read "N/A" rather than a
+    # blank cell; status labels are mapped once per distinct status
+    display_df = jobs_df[display_columns].assign(
+        scheduled_start_time=format_datetime_column(jobs_df['scheduled_start_time']),
+        job_status=format_status_column(jobs_df['job_status']),
     )
-    display_df['job_status'] = display_df['job_status'].apply(
-        lambda x: format_status(x) if pd.notna(x) else 'Unknown'
-    )
-
-    display_df.columns = [
-        lang.get("job_number"), lang.get("title"), lang.get("status"),
-        lang.get("customer"), lang.get("scheduled_start"),
-        lang.get("priority"), lang.get("parts_status")
-    ]
 
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    column_config = {
+        'job_number': st.column_config.TextColumn(lang.get("job_number")),
+        'title': st.column_config.TextColumn(lang.get("title")),
+        'job_status': st.column_config.TextColumn(lang.get("status")),
+        'customer_name': st.column_config.TextColumn(lang.get("customer")),
+        'scheduled_start_time': st.column_config.TextColumn(lang.get("scheduled_start")),
+        'priority': st.column_config.TextColumn(lang.get("priority")),
+        'parts_status': st.column_config.TextColumn(lang.get("parts_status")),
+    }
+
+    st.dataframe(
+        display_df, column_config=column_config,
+        use_container_width=True, hide_index=True
+    )
 
 
 def render_map_view(jobs_df: pd.DataFrame, lang: Language):
     """Render map view of jobs."""
     st.subheader(lang.get("location"))
 
-    valid_coords = jobs_df[
-        jobs_df['latitude'].notna() & jobs_df['longitude'].notna()
-    ].copy()
-
-    if valid_coords.empty:
+    if jobs_df.empty:
         st.info("No location data available")
         return
 
-    map_df = valid_coords[['latitude', 'longitude']].copy()
-    map_df.columns = ['lat', 'lon']
+    # The EU-bounds WHERE clause in the loader only matches rows with both
+    # coordinates set, so the lean frame is built straight from the columns'
+    # arrays without a notna() scan or copying the job rows
+    map_df = pd.DataFrame({
+        'lat': jobs_df['latitude'].to_numpy(),
+        'lon': jobs_df['longitude'].to_numpy(),
+    }, copy=False)
     st.map(map_df, zoom=4)
     st.caption(f"Showing {len(map_df)} jobs with location data")
 
 
+@st.cache_data(ttl=AppSettings.CACHE_TTL_SHORT, show_spinner=False)
+def _lookup_job(job_number: str):
+    """
+    Look up one job by number, cached per job number.
+    Cleared after each sync along with the other job data.
+
+    Args:
+        job_number: Job number to look up
+
+    Returns:
+        Job dictionary or None if not found
+    """
+    return JobQueries.get_job_by_number(job_number)
+
+
 def render_job_lookup_page(lang: Language):
     """Render single job lookup page."""
     st.title(lang.get("job_lookup"))
     st.markdown("Search for a specific job by job number.")
 
-    job_number = st.text_input(lang.get("enter_job_number"), placeholder="JOB-001")
+    # In a form the page only reruns on Enter or the button, not on every
+    # edit, and Enter runs the lookup directly
+    with st.form("job_lookup_form", border=False):
+        job_number = st.text_input(lang.get("enter_job_number"), placeholder="JOB-001")
+        submitted = st.form_submit_button(lang.get("search"), type="primary")
 
-    if st.button(lang.get("search"), type="primary"):
+    if submitted:
         if job_number:
-            job = JobQueries.get_job_by_number(job_number.strip())
+            job = _lookup_job(job_number.strip())
             if job:
                 st.success(f"Job found: {job_number}")
                 st.divider()
@@ -551,7 +791,7 @@ def render_sync_page(lang: Language):
     """Render data sync page."""
     st.title(lang.get("sync"))
 
-    if not is_zuper_configured():
+    if not _zuper_configured():
         st.error("Zuper API not configured. Please add API credentials to secrets.")
         st.markdown("""
         ### Setup Required
@@ -567,19 +807,26 @@ def render_sync_page(lang: Language):
     st.markdown("Synchronize job data from Zuper API to the local database.")
     st.warning("**Note:** Sync may take several minutes depending on the number of jobs.")
 
+    full_sync = st.checkbox(
+        "Full sync",
+        help="Rewrite every job, including ones unchanged since the last sync."
+    )
+
     if st.button(lang.get("sync_now"), type="primary"):
         try:
             with st.spinner("Synchronizing data..."):
-                api_client = get_zuper_client()
-                sync_manager = SyncManager(api_client)
-                stats = sync_manager.sync_all_jobs()
+                stats = _get_sync_manager().sync_all_jobs(full_sync=full_sync)
+
+                # Drop cached reads so every page sees the new data
+                _invalidate_jobs_data()
 
                 if stats['status'] == 'completed':
                     st.success(lang.get("sync_success"))
-                    col1, col2, col3 = st.columns(3)
+                    col1, col2, col3, col4 = st.columns(4)
                     col1.metric("Jobs Fetched", stats['jobs_fetched'])
                     col2.metric("Jobs Created", stats['jobs_created'])
                     col3.metric("Jobs Updated", stats['jobs_updated'])
+                    col4.metric("Jobs Unchanged", stats['jobs_skipped'])
 
                     if stats.get('errors'):
                         st.warning(f"{len(stats['errors'])} errors occurred")
@@ -600,24 +847,35 @@ def render_sync_page(lang: Language):
 def render_export_options(jobs_df: pd.DataFrame, lang: Language):
     """Render export options."""
     st.subheader(lang.get("export"))
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
 
+    export_date = datetime.now().strftime('%Y%m%d')
+
+    # The payloads are built only when a button is clicked; passing bytes
+    # would hash and serialize the filtered frame on every rerun
     with col1:
-        csv = jobs_df.to_csv(index=False)
         st.download_button(
-            "Download as CSV", csv,
-            f"eu_parts_jobs_{datetime.now().strftime('%Y%m%d')}.csv",
+            "Download as CSV", lambda: df_to_csv(_without_search_blobs(jobs_df)),
+            f"eu_parts_jobs_{export_date}.csv",
             "text/csv"
         )
 
     with col2:
-        json_str = jobs_df.to_json(orient='records', date_format='iso', indent=2)
         st.download_button(
-            "Download as JSON", json_str,
-            f"eu_parts_jobs_{datetime.now().strftime('%Y%m%d')}.json",
+            "Download as JSON", lambda: df_to_json(_without_search_blobs(jobs_df)),
+            f"eu_parts_jobs_{export_date}.json",
             "application/json"
         )
 
+    # Parquet needs pyarrow; compact and typed, for loading into other tools
+    if PYARROW_AVAILABLE:
+        with col3:
+            st.download_button(
+                "Download as Parquet", lambda: df_to_parquet(_without_search_blobs(jobs_df)),
+                f"eu_parts_jobs_{export_date}.parquet",
+                "application/vnd.apache.parquet"
+            )
+
 
 def render_ai_assistant_page(lang: Language):
     """Render AI assistant page with chat and summary generation."""
@@ -626,20 +884,18 @@ def render_ai_assistant_page(lang: Language):
 
     # Load job data for context
     try:
-        jobs_df = JobQueries.get_all_eu_parts_jobs()
-        jobs_list = jobs_df.to_dict('records') if not jobs_df.empty else []
+        jobs_df = _get_jobs_df()
 
         # Build context for AI
-        status_counts = jobs_df['job_status'].value_counts().to_dict() if not jobs_df.empty else {}
         context = {
             "total_jobs": len(jobs_df),
-            "status_counts": status_counts,
+            "status_counts": st.session_state.jobs_status_counts,
             "current_filters": None
         }
 
     except Exception as e:
         logger.error(f"Error loading jobs for AI: {e}")
-        jobs_list = []
+        jobs_df = pd.DataFrame()
         context = {"total_jobs": 0, "status_counts": {}}
 
     # Two-column layout
@@ -651,9 +907,10 @@ def render_ai_assistant_page(lang: Language):
     with col2:
         st.markdown("### Quick Actions")
 
-        # Summary generator
-        if jobs_list:
-            render_summary_generator(jobs_list)
+        # Summary generator; job dicts are only built if a summary is
+        # actually generated, not on every rerun while chatting
+        if not jobs_df.empty:
+            render_summary_generator(lambda: _without_search_blobs(jobs_df).to_dict('records'))
 
         st.divider()
 
@@ -684,11 +941,14 @@ def main():
             st.warning("AI Assistant is not available. Please configure your Anthropic API key.")
     elif selected_page == "bulk_lookup":
         if FeatureFlags.ENABLE_BULK_LOOKUP:
+            # Page modules are imported on first visit, not at app start
+            from components.bulk_lookup import render_bulk_lookup
             render_bulk_lookup(lang)
         else:
             st.warning("Bulk lookup is currently disabled")
     elif selected_page == "parts_inventory":
         if FeatureFlags.ENABLE_PARTS_INVENTORY:
+            from components.parts_inventory import render_parts_inventory
             render_parts_inventory(lang)
         else:
             st.warning("Parts inventory is currently disabled")
@@ -699,7 +959,8 @@ def main():
             st.warning("Manual sync is currently disabled")
 
     st.divider()
-    st.caption(f"EU Parts Job Dashboard | Last updated: {format_datetime(datetime.now())}")
+    # Formatted once when this session's job data (re)loads, not per rerun
+    st.caption(f"EU Parts Job Dashboard | Last updated: {st.session_state.jobs_df_updated_text}")
 
 
 if __name__ == "__main__":
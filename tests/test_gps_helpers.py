@@ -0,0 +1,30 @@
+"""
+Tests for GPS helper functions.
+"""
+
+import unittest
+
+from utils.gps_helpers import parse_coordinates_string
+
+
+class ParseCoordinatesStringTest(unittest.TestCase):
+    """parse_coordinates_string accepts only well-formed strings."""
+
+    def test_parses_valid_string(self):
+        self.assertEqual(parse_coordinates_string("52.3676, 4.9041"), (52.3676, 4.9041))
+        self.assertEqual(parse_coordinates_string("52.3676,4.9041"), (52.3676, 4.9041))
+
+    def test_rejects_malformed_or_out_of_range_strings(self):
+        self.assertIsNone(parse_coordinates_string("52.3676"))
+        self.assertIsNone(parse_coordinates_string("north, east"))
+        self.assertIsNone(parse_coordinates_string("95.0, 4.9"))
+
+    def test_rejects_non_string_input(self):
+        self.assertIsNone(parse_coordinates_string(None))
+        self.assertIsNone(parse_coordinates_string(""))
+        self.assertIsNone(parse_coordinates_string([52.3676, 4.9041]))
+        self.assertIsNone(parse_coordinates_string({"lat": 52.3676}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Tests for SyncManager against a temporary SQLite database.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import database.connection as connection
+from src.sync.sync_manager import SyncManager
+from src.zuper_api.exceptions import ZuperAPIError
+
+
+def make_job(number: int, uid: str = None, updated_at: str = "2024-01-01T10:00:00Z") -> dict:
+    """Build a minimal Zuper API job payload."""
+    job = {
+        "work_order_number": str(number),
+        "job_title": f"Job {number}",
+        "customer_address": {"geo_cordinates": [52.0, 5.0], "first_name": "Customer"},
+        "job_category": {"category_name": "Field Requires Parts"},
+        "current_job_status": {"status_name": "Shipped"},
+        "updated_at": updated_at,
+    }
+    if uid is not None:
+        job["job_uid"] = uid
+    return job
+
+
+class FakeZuperClient:
+    """Stands in for ZuperAPIClient, serving fixed pages of jobs.
+
+    An exception in place of a page is raised when that page is reached;
+    None in place of a page reports it as failed and skipped.
+    """
+
+    def __init__(self, *pages):
+        self.pages = pages
+
+    def iter_eu_parts_jobs_pages(self, failed_pages=None):
+        for number, page in enumerate(self.pages, start=1):
+            if isinstance(page, Exception):
+                raise page
+            if page is None:
+                failed_pages.append(number)
+                continue
+            yield page
+
+
+class SyncManagerTest(unittest.TestCase):
+    """Sync runs against a fresh database file per test."""
+
+    def setUp(self):
+        self.db_dir = Path(tempfile.mkdtemp())
+        patches = [
+            mock.patch.object(connection, "DB_DIR", self.db_dir),
+            mock.patch.object(connection, "DB_FILE", self.db_dir / "test.db"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        connection.get_db_connection.clear()
+        self.conn = connection.get_db_connection()
+
+    def tearDown(self):
+        self.conn.close()
+        connection.get_db_connection.clear()
+        shutil.rmtree(self.db_dir, ignore_errors=True)
+
+    def sync(self, *pages) -> dict:
+        """Run one sync over the given pages of jobs."""
+        return SyncManager(FakeZuperClient(*pages)).sync_all_jobs()
+
+    def stored_jobs(self) -> list:
+        """Return (job_uid, job_number) of every stored job."""
+        return [
+            tuple(row) for row in
+            self.conn.execute("SELECT job_uid, job_number FROM jobs ORDER BY job_number")
+        ]
+
+    def test_job_without_uid_is_skipped_not_stored(self):
+        stats = self.sync([make_job(1, uid="uid-1"), make_job(2)])
+
+        self.assertEqual(stats["status"], "completed")
+        self.assertEqual(stats["jobs_created"], 1)
+        self.assertEqual(stats["jobs_skipped"], 1)
+        self.assertEqual(len(stats["errors"]), 1)
+        self.assertIn("no job_uid", stats["errors"][0])
+        self.assertEqual(self.stored_jobs(), [("uid-1", "1")])
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM jobs WHERE job_uid IS NULL").fetchone()[0], 0
+        )
+
+    def test_job_without_uid_does_not_break_later_syncs(self):
+        self.sync([make_job(1, uid="uid-1"), make_job(2)])
+        stats = self.sync([make_job(1, uid="uid-1"), make_job(2)])
+
+        self.assertEqual(stats["jobs_skipped"], 2)
+        self.assertEqual(len(stats["errors"]), 1)
+        self.assertEqual(self.stored_jobs(), [("uid-1", "1")])
+
+    def test_reused_job_number_replaces_the_stale_job(self):
+        self.sync([make_job(1, uid="uid-old"), make_job(2, uid="uid-2")])
+        stats = self.sync([
+            make_job(1, uid="uid-new", updated_at="2024-02-01T10:00:00Z"),
+            make_job(2, uid="uid-2"),
+        ])
+
+        self.assertEqual(stats["errors"], [])
+        self.assertEqual(stats["jobs_created"], 1)
+        self.assertEqual(stats["jobs_skipped"], 1)
+        self.assertEqual(self.stored_jobs(), [("uid-new", "1"), ("uid-2", "2")])
+
+        # The clash is resolved once, not reported again on the next sync
+        stats = self.sync([make_job(1, uid="uid-new", updated_at="2024-02-01T10:00:00Z")])
+        self.assertEqual(stats["errors"], [])
+        self.assertEqual(stats["jobs_skipped"], 1)
+
+    def test_unchanged_job_does_not_claim_another_jobs_number(self):
+        self.sync([make_job(1, uid="uid-1"), make_job(2, uid="uid-2")])
+
+        # uid-2 now reports number 1 but is not newer, so the merge skips it
+        # and uid-1 keeps its row
+        stats = self.sync([make_job(1, uid="uid-2")])
+
+        self.assertEqual(stats["jobs_skipped"], 1)
+        self.assertEqual(self.stored_jobs(), [("uid-1", "1"), ("uid-2", "2")])
+
+    def test_job_numbers_swapped_in_one_sync(self):
+        self.sync([make_job(1, uid="uid-1"), make_job(2, uid="uid-2")])
+        stats = self.sync([
+            make_job(2, uid="uid-1", updated_at="2024-02-01T10:00:00Z"),
+            make_job(1, uid="uid-2", updated_at="2024-02-01T10:00:00Z"),
+        ])
+
+        self.assertEqual(stats["errors"], [])
+        self.assertEqual(self.stored_jobs(), [("uid-2", "1"), ("uid-1", "2")])
+
+    def test_failed_sync_logs_no_rolled_back_counts(self):
+        stats = self.sync(
+            [make_job(1, uid="uid-1"), make_job(2, uid="uid-2")],
+            ZuperAPIError("page 2 failed"),
+        )
+
+        self.assertEqual(stats["status"], "failed")
+        self.assertEqual(stats["jobs_fetched"], 2)
+        self.assertEqual(
+            (stats["jobs_created"], stats["jobs_updated"], stats["jobs_skipped"]), (0, 0, 0)
+        )
+        self.assertEqual(self.stored_jobs(), [])
+
+        logged = self.conn.execute(
+            "SELECT status, jobs_created, jobs_updated, jobs_skipped FROM sync_log WHERE sync_id = ?",
+            (stats["sync_id"],)
+        ).fetchone()
+        self.assertEqual(tuple(logged), ("failed", 0, 0, 0))
+
+    def test_skipped_pages_are_reported(self):
+        stats = self.sync([make_job(1, uid="uid-1")], None, [make_job(3, uid="uid-3")], None)
+
+        self.assertEqual(stats["status"], "completed")
+        self.assertEqual(stats["jobs_created"], 2)
+        self.assertEqual(len(stats["errors"]), 1)
+        self.assertIn("pages 2, 4", stats["errors"][0])
+        self.assertEqual(self.stored_jobs(), [("uid-1", "1"), ("uid-3", "3")])
+
+
+if __name__ == "__main__":
+    unittest.main()
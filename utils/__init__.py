@@ -6,6 +6,8 @@ from utils.language import Language
 from utils.formatters import (
     format_datetime,
     format_status,
+    format_datetime_column,
+    format_status_column,
     format_priority,
     format_currency,
     format_coordinates,
@@ -18,10 +20,16 @@ from utils.formatters import (
     status_badge,
     priority_badge
 )
+from utils.export import df_to_csv, df_to_json, df_to_parquet
 from utils.gps_helpers import (
     is_in_eu_bounds,
+    is_in_eu_bounds_array,
     validate_coordinates,
+    validate_coordinates_array,
     calculate_distance,
+    calculate_distance_fast,
+    calculate_distance_vector,
+    JobLocationIndex,
     get_center_point,
     get_country_from_coordinates,
     format_map_data,
@@ -36,6 +44,8 @@ __all__ = [
     'Language',
     'format_datetime',
     'format_status',
+    'format_datetime_column',
+    'format_status_column',
     'format_priority',
     'format_currency',
     'format_coordinates',
@@ -47,9 +57,17 @@ __all__ = [
     'format_boolean',
     'status_badge',
     'priority_badge',
+    'df_to_csv',
+    'df_to_json',
+    'df_to_parquet',
     'is_in_eu_bounds',
+    'is_in_eu_bounds_array',
     'validate_coordinates',
+    'validate_coordinates_array',
     'calculate_distance',
+    'calculate_distance_fast',
+    'calculate_distance_vector',
+    'JobLocationIndex',
     'get_center_point',
     'get_country_from_coordinates',
     'format_map_data',
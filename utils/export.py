@@ -0,0 +1,94 @@
+"""
+Export utilities for the dashboard's CSV, JSON and Parquet downloads.
+Serialized payloads are cached, so reruns don't re-serialize unchanged rows;
+the caches expire and hold only a few payloads each.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from config.settings import AppSettings
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@st.cache_data(
+    ttl=AppSettings.CACHE_TTL_SHORT,
+    max_entries=AppSettings.EXPORT_CACHE_MAX_ENTRIES,
+    show_spinner=False
+)
+def df_to_csv(jobs_df: pd.DataFrame) -> bytes:
+    """
+    Serialize jobs for a CSV download; rebuilt only when the rows change.
+
+    Args:
+        jobs_df: DataFrame with job data
+
+    Returns:
+        UTF-8 encoded CSV
+    """
+    if PYARROW_AVAILABLE:
+        table = pa.Table.from_pandas(jobs_df, preserve_index=False)
+        # The CSV writer has no dictionary support, so decode categoricals
+        table = table.cast(pa.schema(
+            pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type) else f
+            for f in table.schema
+        ))
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(table, buffer)
+        return buffer.getvalue().to_pybytes()
+    return jobs_df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(
+    ttl=AppSettings.CACHE_TTL_SHORT,
+    max_entries=AppSettings.EXPORT_CACHE_MAX_ENTRIES,
+    show_spinner=False
+)
+def df_to_json(jobs_df: pd.DataFrame) -> bytes:
+    """
+    Serialize jobs for a JSON download; rebuilt only when the rows change.
+
+    Args:
+        jobs_df: DataFrame with job data
+
+    Returns:
+        UTF-8 encoded JSON array of job records
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(jobs_df.to_dict('records'), option=orjson.OPT_NAIVE_UTC)
+    return jobs_df.to_json(orient='records', date_format='iso').encode('utf-8')
+
+
+@st.cache_data(
+    ttl=AppSettings.CACHE_TTL_SHORT,
+    max_entries=AppSettings.EXPORT_CACHE_MAX_ENTRIES,
+    show_spinner=False
+)
+def df_to_parquet(jobs_df: pd.DataFrame) -> bytes:
+    """
+    Serialize jobs for a Parquet download; rebuilt only when the rows change.
+    Requires pyarrow; callers should check PYARROW_AVAILABLE first.
+
+    Args:
+        jobs_df: DataFrame with job data
+
+    Returns:
+        zstd-compressed Parquet file
+    """
+    table = pa.Table.from_pandas(jobs_df, preserve_index=False)
+    buffer = pa.BufferOutputStream()
+    pa_parquet.write_table(table, buffer, compression='zstd')
+    return buffer.getvalue().to_pybytes()
@@ -3,7 +3,9 @@ Formatting utilities for displaying data in the dashboard.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Any
+import pandas as pd
 import streamlit as st
 
 
@@ -51,6 +53,42 @@ def format_status(status: Optional[str]) -> str:
     return status
 
 
+def format_datetime_column(values: pd.Series, date_only: bool = False) -> pd.Series:
+    """
+    Format a column of datetimes for display in one vectorized pass.
+    Values that don't parse are shown as stored; missing values as "N/A".
+
+    Args:
+        values: Series of datetime strings or objects
+        date_only: If True, show only date
+
+    Returns:
+        Series of formatted datetime strings
+    """
+    parsed = pd.to_datetime(values, errors='coerce')
+    date_format = "%Y-%m-%d" if date_only else "%Y-%m-%d %H:%M"
+    return (
+        parsed.dt.strftime(date_format)
+        .astype(object)
+        .where(parsed.notna(), values)
+        .fillna("N/A")
+    )
+
+
+def format_status_column(values: pd.Series) -> pd.Series:
+    """
+    Format a column of job statuses, calling format_status once per distinct value.
+
+    Args:
+        values: Series of job status strings
+
+    Returns:
+        Series of formatted status strings
+    """
+    labels = {status: format_status(status) for status in values.dropna().unique()}
+    return values.map(labels).astype(object).fillna("Unknown")
+
+
 def format_priority(priority: Optional[str]) -> str:
     """
     Format priority with emoji indicator.
@@ -194,6 +232,12 @@ def format_list(items: Optional[list], separator: str = ", ") -> str:
         return str(items)
 
 
+# str.translate table that deletes every non-digit ASCII character
+_DELETE_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if not chr(code).isdigit()
+))
+
+
 def format_phone(phone: Optional[str]) -> str:
     """
     Format phone number for display.
@@ -207,8 +251,12 @@ def format_phone(phone: Optional[str]) -> str:
     if not phone:
         return "N/A"
 
-    # Remove all non-digit characters
-    digits = ''.join(filter(str.isdigit, phone))
+    # Remove all non-digit characters; the table covers ASCII, which is
+    # what phone numbers almost always are
+    if phone.isascii():
+        digits = phone.translate(_DELETE_NON_DIGITS)
+    else:
+        digits = ''.join(filter(str.isdigit, phone))
 
     # Format based on length
     if len(digits) == 10:  # Dutch mobile
@@ -257,6 +305,34 @@ def format_boolean(value: Optional[bool], true_text: str = "Yes", false_text: st
     return true_text if value else false_text
 
 
+# Badge colors; values not listed fall back to _DEFAULT_BADGE_COLOR
+_STATUS_BADGE_COLORS = {
+    "new ticket": "#3498db",        # Blue
+    "received request": "#9b59b6",  # Purple
+    "parts on order": "#f39c12",    # Orange
+    "shop pick up": "#27ae60",      # Green
+    "shipped": "#16a085",           # Teal
+    "parts delivered": "#2ecc71",   # Bright green
+    "done": "#2ecc71",              # Bright green
+    "canceled": "#95a5a6",          # Gray
+}
+
+_PRIORITY_BADGE_COLORS = {
+    "urgent": "#F44336",    # Red
+    "high": "#FF9800",      # Orange
+    "medium": "#2196F3",    # Blue
+    "normal": "#4CAF50",    # Green
+    "low": "#9E9E9E",       # Grey
+}
+
+_DEFAULT_BADGE_COLOR = "#607D8B"  # Blue Grey
+
+_BADGE_TEMPLATE = '<span style="background-color: {color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.85em; font-weight: 500;">{text}</span>'
+
+
+# Statuses and priorities are a handful of distinct values, so each badge
+# is built once and every later card reuses the cached HTML string
+@lru_cache(maxsize=256)
 def status_badge(status: str) -> str:
     """
     Create a colored badge for job status.
@@ -268,22 +344,12 @@ def status_badge(status: str) -> str:
     Returns:
         HTML string with colored badge
     """
-    status_colors = {
-        "new ticket": "#3498db",        # Blue
-        "received request": "#9b59b6",  # Purple
-        "parts on order": "#f39c12",    # Orange
-        "shop pick up": "#27ae60",      # Green
-        "shipped": "#16a085",           # Teal
-        "parts delivered": "#2ecc71",   # Bright green
-        "done": "#2ecc71",              # Bright green
-        "canceled": "#95a5a6",          # Gray
-    }
+    color = _STATUS_BADGE_COLORS.get(status.lower(), _DEFAULT_BADGE_COLOR)
 
-    color = status_colors.get(status.lower(), "#607D8B")  # Default: Blue Grey
-
-    return f'<span style="background-color: {color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.85em; font-weight: 500;">{status}</span>'
+    return _BADGE_TEMPLATE.format(color=color, text=status)
 
 
+@lru_cache(maxsize=256)
 def priority_badge(priority: str) -> str:
     """
     Create a colored badge for priority.
@@ -294,14 +360,6 @@ def priority_badge(priority: str) -> str:
     Returns:
         HTML string with colored badge
     """
-    priority_colors = {
-        "urgent": "#F44336",    # Red
-        "high": "#FF9800",      # Orange
-        "medium": "#2196F3",    # Blue
-        "normal": "#4CAF50",    # Green
-        "low": "#9E9E9E",       # Grey
-    }
-
-    color = priority_colors.get(priority.lower(), "#607D8B")
+    color = _PRIORITY_BADGE_COLORS.get(priority.lower(), _DEFAULT_BADGE_COLOR)
 
-    return f'<span style="background-color: {color}; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.85em; font-weight: 500;">{priority}</span>'
+    return _BADGE_TEMPLATE.format(color=color, text=priority)
@@ -4,7 +4,12 @@ Handles coordinate validation, distance calculations, and map display.
 """
 
 import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Tuple, Optional, List, Dict, Any
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 
@@ -16,6 +21,45 @@ EU_BOUNDS = {
     "max_lon": 40.0
 }
 
+# "lat, lon" with optional whitespace; each number is a signed decimal
+# with an optional exponent, as float() accepts
+_COORDINATE_NUMBER = r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?'
+_COORDINATES_PATTERN = re.compile(
+    rf'\s*({_COORDINATE_NUMBER})\s*,\s*({_COORDINATE_NUMBER})\s*'
+)
+
+# Map zoom by number of jobs shown: _ZOOM_LEVELS[i] applies from
+# _ZOOM_JOB_COUNTS[i - 1] jobs up to the next threshold
+_ZOOM_JOB_COUNTS = (1, 2, 10, 50)
+_ZOOM_LEVELS = (
+    4,   # No jobs: Europe-wide view
+    13,  # One job: city-level view
+    8,   # Under 10: regional view
+    6,   # Under 50: country-level view
+    4,   # 50 or more: Europe-wide view
+)
+
+# Marker tooltip, filled from a format_map_data() marker dict
+_MAP_TOOLTIP_TEMPLATE = """
+    <b>{job_number}</b><br/>
+    {title}<br/>
+    Status: {status}<br/>
+    Customer: {customer}
+    """
+
+# Earth's radius in kilometers, for the Haversine formula
+EARTH_RADIUS_KM = 6371.0
+
+# Map marker keys, the job column each is read from, and the value used
+# when the frame has no such column
+_MAP_MARKER_FIELDS = [
+    ('job_number', 'job_number', 'N/A'),
+    ('title', 'title', 'N/A'),
+    ('status', 'job_status', 'Unknown'),
+    ('customer', 'customer_name', 'N/A'),
+    ('address', 'job_address', 'N/A'),
+]
+
 
 def is_in_eu_bounds(latitude: float, longitude: float) -> bool:
     """
@@ -37,6 +81,29 @@ def is_in_eu_bounds(latitude: float, longitude: float) -> bool:
     )
 
 
+def is_in_eu_bounds_array(latitudes, longitudes) -> np.ndarray:
+    """
+    Check arrays of coordinates against the EU geographic bounds.
+
+    Array counterpart of is_in_eu_bounds(), for filtering a whole frame
+    with one mask. Missing values (NaN) are outside the bounds.
+
+    Args:
+        latitudes: Latitude values (array-like or Series)
+        longitudes: Longitude values (array-like or Series)
+
+    Returns:
+        Boolean array, True where the location is within EU bounds
+    """
+    lats = _to_float_array(latitudes)
+    lons = _to_float_array(longitudes)
+
+    return (
+        (lats >= EU_BOUNDS["min_lat"]) & (lats <= EU_BOUNDS["max_lat"]) &
+        (lons >= EU_BOUNDS["min_lon"]) & (lons <= EU_BOUNDS["max_lon"])
+    )
+
+
 def validate_coordinates(latitude: float, longitude: float) -> bool:
     """
     Validate GPS coordinates.
@@ -51,22 +118,60 @@ def validate_coordinates(latitude: float, longitude: float) -> bool:
     if latitude is None or longitude is None:
         return False
 
-    try:
-        lat = float(latitude)
-        lon = float(longitude)
-
-        # Check if within valid GPS ranges
-        if not (-90 <= lat <= 90):
-            return False
-
-        if not (-180 <= lon <= 180):
+    # Numbers, the usual case, are range-checked directly; only other
+    # values (e.g. numeric strings) go through float() and its exceptions
+    if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+        lat, lon = latitude, longitude
+    else:
+        try:
+            lat = float(latitude)
+            lon = float(longitude)
+        except (ValueError, TypeError):
             return False
 
-        return True
+    # Check if within valid GPS ranges
+    if not (-90 <= lat <= 90):
+        return False
 
-    except (ValueError, TypeError):
+    if not (-180 <= lon <= 180):
         return False
 
+    return True
+
+
+def _to_float_array(values) -> np.ndarray:
+    """
+    Convert coordinate values to a float array, NaN where unparseable.
+
+    Args:
+        values: Array-like or Series of numbers, numeric strings or None
+
+    Returns:
+        float64 array
+    """
+    return np.asarray(pd.to_numeric(np.asarray(values), errors='coerce'), dtype=np.float64)
+
+
+def validate_coordinates_array(latitudes, longitudes) -> np.ndarray:
+    """
+    Validate arrays of GPS coordinates in one vectorized pass.
+
+    Array counterpart of validate_coordinates(). Missing or unparseable
+    values (NaN after conversion) are invalid.
+
+    Args:
+        latitudes: Latitude values (array-like or Series)
+        longitudes: Longitude values (array-like or Series)
+
+    Returns:
+        Boolean array, True where both coordinates are valid
+    """
+    lats = _to_float_array(latitudes)
+    lons = _to_float_array(longitudes)
+
+    # NaN fails every comparison, so it needs no separate check
+    return (lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180)
+
 
 def calculate_distance(
     lat1: float,
@@ -86,12 +191,9 @@ def calculate_distance(
     Returns:
         Distance in kilometers
     """
-    if not all([lat1, lon1, lat2, lon2]):
+    if None in (lat1, lon1, lat2, lon2):
         return 0.0
 
-    # Earth's radius in kilometers
-    R = 6371.0
-
     # Convert to radians
     lat1_rad = math.radians(lat1)
     lon1_rad = math.radians(lon1)
@@ -105,26 +207,241 @@ def calculate_distance(
     a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
     c = 2 * math.asin(math.sqrt(a))
 
-    distance = R * c
+    distance = EARTH_RADIUS_KM * c
 
     return distance
 
 
+def calculate_distance_fast(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Approximate distance between two GPS coordinates (equirectangular).
+
+    Treats the short path between the points as flat, scaling longitude
+    by the cosine of the mean latitude: one trig call instead of the
+    Haversine formula's five. The error is under 0.1% up to a few
+    hundred kilometers and grows to about 1.5% across the continent
+    (Lisbon to Stockholm), which is fine for display ("about 40 km
+    away"); use calculate_distance() where accuracy matters.
+
+    Args:
+        lat1: Latitude of first point
+        lon1: Longitude of first point
+        lat2: Latitude of second point
+        lon2: Longitude of second point
+
+    Returns:
+        Distance in kilometers
+    """
+    if None in (lat1, lon1, lat2, lon2):
+        return 0.0
+
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+
+    return EARTH_RADIUS_KM * math.hypot(x, y)
+
+
+def calculate_distance_vector(
+    lat1,
+    lon1,
+    lat2,
+    lon2,
+    pairwise: bool = False
+) -> np.ndarray:
+    """
+    Calculate Haversine distances for arrays of GPS coordinates.
+
+    Array counterpart of calculate_distance() for bulk work such as
+    distances from one point to every job. Inputs broadcast against each
+    other, so a scalar first point with array second points gives one
+    distance per job. Missing coordinates (NaN) give NaN distances.
+
+    Args:
+        lat1: Latitude(s) of the first point(s)
+        lon1: Longitude(s) of the first point(s)
+        lat2: Latitude(s) of the second point(s)
+        lon2: Longitude(s) of the second point(s)
+        pairwise: If True, return the (N, M) matrix of distances between
+            every first point and every second point
+
+    Returns:
+        Array of distances in kilometers
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))
+
+    if pairwise:
+        lat1, lon1 = lat1[:, np.newaxis], lon1[:, np.newaxis]
+
+    return _haversine_radians(lat1, lon1, np.cos(lat1), lat2, lon2, np.cos(lat2))
+
+
+def _haversine_radians(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2) -> np.ndarray:
+    """
+    Haversine distances from coordinates already in radians.
+
+    Takes the latitude cosines as arguments so callers that query the
+    same points repeatedly can compute them once.
+
+    Args:
+        lat1: Latitude(s) of the first point(s), in radians
+        lon1: Longitude(s) of the first point(s), in radians
+        cos_lat1: Cosine of lat1
+        lat2: Latitude(s) of the second point(s), in radians
+        lon2: Longitude(s) of the second point(s), in radians
+        cos_lat2: Cosine of lat2
+
+    Returns:
+        Array of distances in kilometers
+    """
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2)**2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
+
+
+class JobLocationIndex:
+    """
+    Spatial index over job coordinates for bounding-box and nearest-job queries.
+
+    Built once per jobs DataFrame. Jobs with valid coordinates are kept
+    sorted by latitude, so a bounding-box query binary-searches the
+    latitude band and only range-checks longitude inside it instead of
+    scanning every job. Results are row positions in the original
+    DataFrame, for use with jobs_df.iloc.
+    """
+
+    def __init__(self, jobs_df: pd.DataFrame):
+        """
+        Build the index from a jobs DataFrame.
+
+        Args:
+            jobs_df: DataFrame with latitude and longitude columns
+        """
+        lats = _to_float_array(jobs_df['latitude'])
+        lons = _to_float_array(jobs_df['longitude'])
+
+        # Jobs without a valid location are left out
+        valid = np.flatnonzero(validate_coordinates_array(lats, lons))
+        order = valid[np.argsort(lats[valid], kind='stable')]
+
+        self._positions = order
+        self._lats = lats[order]
+        self._lons = lons[order]
+
+        # Radians and latitude cosines for nearest_jobs(), computed once
+        # here rather than for every job on every query
+        self._lats_rad = np.radians(self._lats)
+        self._lons_rad = np.radians(self._lons)
+        self._cos_lats = np.cos(self._lats_rad)
+
+    def __len__(self) -> int:
+        """Number of indexed jobs (jobs with valid coordinates)."""
+        return len(self._positions)
+
+    def jobs_in_bbox(self, bbox: Dict[str, float]) -> np.ndarray:
+        """
+        Find jobs inside a bounding box.
+
+        Args:
+            bbox: Dictionary with min_lat, max_lat, min_lon, max_lon, as
+                returned by get_bounding_box() or EU_BOUNDS
+
+        Returns:
+            Row positions of matching jobs, in latitude order
+        """
+        start = np.searchsorted(self._lats, bbox["min_lat"], side='left')
+        stop = np.searchsorted(self._lats, bbox["max_lat"], side='right')
+
+        lons = self._lons[start:stop]
+        in_box = (lons >= bbox["min_lon"]) & (lons <= bbox["max_lon"])
+
+        return self._positions[start:stop][in_box]
+
+    def nearest_jobs(self, latitude: float, longitude: float, k: int = 5) -> np.ndarray:
+        """
+        Find the k jobs closest to a point.
+
+        Args:
+            latitude: Latitude of the point
+            longitude: Longitude of the point
+            k: Number of jobs to return
+
+        Returns:
+            Row positions of the nearest jobs, closest first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        lat_rad = math.radians(latitude)
+        distances = _haversine_radians(
+            lat_rad, math.radians(longitude), math.cos(lat_rad),
+            self._lats_rad, self._lons_rad, self._cos_lats
+        )
+
+        # Select the k smallest without sorting every distance, then order them
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+
+        return self._positions[nearest]
+
+
+def _valid_coordinate_array(coordinates) -> np.ndarray:
+    """
+    Convert array-like coordinates to a float array of valid rows.
+
+    Args:
+        coordinates: (N, 2) array of (latitude, longitude) pairs, or a
+            DataFrame with latitude and longitude columns (any other
+            DataFrame is read as its first two columns)
+
+    Returns:
+        (M, 2) float array, without rows that have a missing coordinate
+    """
+    if isinstance(coordinates, pd.DataFrame):
+        if {'latitude', 'longitude'} <= set(coordinates.columns):
+            coordinates = coordinates[['latitude', 'longitude']]
+        else:
+            coordinates = coordinates.iloc[:, :2]
+
+    coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    return coords[~np.isnan(coords).any(axis=1)]
+
+
 def get_center_point(coordinates: List[Tuple[float, float]]) -> Tuple[float, float]:
     """
     Calculate center point of multiple coordinates.
 
     Args:
-        coordinates: List of (latitude, longitude) tuples
+        coordinates: List of (latitude, longitude) tuples, or an
+            array/DataFrame of them (see _valid_coordinate_array)
 
     Returns:
         Tuple of (center_lat, center_lon)
     """
+    if isinstance(coordinates, (pd.DataFrame, np.ndarray)):
+        coords = _valid_coordinate_array(coordinates)
+        if len(coords) == 0:
+            return (52.5, 13.4)
+        center = coords.mean(axis=0)
+        return (float(center[0]), float(center[1]))
+
     if not coordinates:
         # Default to center of EU
         return (52.5, 13.4)  # Berlin
 
-    valid_coords = [(lat, lon) for lat, lon in coordinates if lat and lon]
+    valid_coords = [(lat, lon) for lat, lon in coordinates if lat is not None and lon is not None]
 
     if not valid_coords:
         return (52.5, 13.4)
@@ -135,6 +452,8 @@ def get_center_point(coordinates: List[Tuple[float, float]]) -> Tuple[float, flo
     return (avg_lat, avg_lon)
 
 
+# Jobs share sites, so the same coordinates are looked up over and over
+@lru_cache(maxsize=4096)
 def get_country_from_coordinates(latitude: float, longitude: float) -> str:
     """
     Get approximate country from coordinates (simplified).
@@ -180,30 +499,30 @@ def format_map_data(jobs_df) -> List[Dict[str, Any]]:
     """
     Format job data for map display.
 
+    Coordinates are validated for the whole frame at once; rows whose
+    latitude or longitude is missing, unparseable or out of range are
+    left out.
+
     Args:
         jobs_df: DataFrame with job data
 
     Returns:
         List of dictionaries formatted for map markers
     """
-    map_data = []
+    if 'latitude' not in jobs_df or 'longitude' not in jobs_df:
+        return []
 
-    for _, job in jobs_df.iterrows():
-        lat = job.get('latitude')
-        lon = job.get('longitude')
+    lats = _to_float_array(jobs_df['latitude'])
+    lons = _to_float_array(jobs_df['longitude'])
 
-        if validate_coordinates(lat, lon):
-            map_data.append({
-                'lat': lat,
-                'lon': lon,
-                'job_number': job.get('job_number', 'N/A'),
-                'title': job.get('title', 'N/A'),
-                'status': job.get('job_status', 'Unknown'),
-                'customer': job.get('customer_name', 'N/A'),
-                'address': job.get('job_address', 'N/A')
-            })
+    valid = validate_coordinates_array(lats, lons)
+    valid_jobs = jobs_df[valid]
 
-    return map_data
+    map_df = pd.DataFrame({'lat': lats[valid], 'lon': lons[valid]}, index=valid_jobs.index)
+    for key, column, default in _MAP_MARKER_FIELDS:
+        map_df[key] = valid_jobs[column] if column in valid_jobs else default
+
+    return map_df.to_dict('records')
 
 
 def create_map_tooltip(job: Dict[str, Any]) -> str:
@@ -216,12 +535,7 @@ def create_map_tooltip(job: Dict[str, Any]) -> str:
     Returns:
         HTML tooltip string
     """
-    return f"""
-    <b>{job['job_number']}</b><br/>
-    {job['title']}<br/>
-    Status: {job['status']}<br/>
-    Customer: {job['customer']}
-    """
+    return _MAP_TOOLTIP_TEMPLATE.format_map(job)
 
 
 def get_zoom_level(jobs_count: int) -> int:
@@ -234,16 +548,7 @@ def get_zoom_level(jobs_count: int) -> int:
     Returns:
         Zoom level (1-20)
     """
-    if jobs_count == 0:
-        return 4  # Europe-wide view
-    elif jobs_count == 1:
-        return 13  # City-level view
-    elif jobs_count < 10:
-        return 8   # Regional view
-    elif jobs_count < 50:
-        return 6   # Country-level view
-    else:
-        return 4   # Europe-wide view
+    return _ZOOM_LEVELS[bisect_right(_ZOOM_JOB_COUNTS, jobs_count)]
 
 
 def parse_coordinates_string(coord_string: str) -> Optional[Tuple[float, float]]:
@@ -256,26 +561,29 @@ def parse_coordinates_string(coord_string: str) -> Optional[Tuple[float, float]]
     Returns:
         Tuple of (latitude, longitude) or None if invalid
     """
-    if not coord_string:
+    # Checked before the cached parser, which would raise TypeError on
+    # unhashable input such as a list
+    if not coord_string or not isinstance(coord_string, str):
         return None
 
-    try:
-        # Split by comma
-        parts = coord_string.replace(' ', '').split(',')
+    return _parse_coordinates_str(coord_string)
 
-        if len(parts) != 2:
-            return None
 
-        lat = float(parts[0])
-        lon = float(parts[1])
+@lru_cache(maxsize=4096)
+def _parse_coordinates_str(coord_string: str) -> Optional[Tuple[float, float]]:
+    """Parse a non-empty coordinates string; see parse_coordinates_string."""
+    # Malformed input is rejected by the pattern, so float() never raises
+    match = _COORDINATES_PATTERN.fullmatch(coord_string)
+    if not match:
+        return None
 
-        if validate_coordinates(lat, lon):
-            return (lat, lon)
+    lat = float(match.group(1))
+    lon = float(match.group(2))
 
-        return None
+    if validate_coordinates(lat, lon):
+        return (lat, lon)
 
-    except (ValueError, AttributeError):
-        return None
+    return None
 
 
 def get_bounding_box(coordinates: List[Tuple[float, float]]) -> Dict[str, float]:
@@ -283,15 +591,29 @@ def get_bounding_box(coordinates: List[Tuple[float, float]]) -> Dict[str, float]
     Calculate bounding box for a list of coordinates.
 
     Args:
-        coordinates: List of (latitude, longitude) tuples
+        coordinates: List of (latitude, longitude) tuples, or an
+            array/DataFrame of them (see _valid_coordinate_array)
 
     Returns:
         Dictionary with min_lat, max_lat, min_lon, max_lon
     """
+    if isinstance(coordinates, (pd.DataFrame, np.ndarray)):
+        coords = _valid_coordinate_array(coordinates)
+        if len(coords) == 0:
+            return EU_BOUNDS
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
+        return {
+            "min_lat": float(mins[0]),
+            "max_lat": float(maxs[0]),
+            "min_lon": float(mins[1]),
+            "max_lon": float(maxs[1])
+        }
+
     if not coordinates:
         return EU_BOUNDS
 
-    valid_coords = [(lat, lon) for lat, lon in coordinates if lat and lon]
+    valid_coords = [(lat, lon) for lat, lon in coordinates if lat is not None and lon is not None]
 
     if not valid_coords:
         return EU_BOUNDS
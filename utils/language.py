@@ -9,6 +9,9 @@ from typing import Dict
 class Language:
     """Language translation manager."""
 
+    # A new instance is built on every rerun; slots skip the per-instance __dict__
+    __slots__ = ('language', '_translations')
+
     # Translation dictionary
     TRANSLATIONS = {
         "en": {
@@ -158,6 +161,7 @@ class Language:
             language: Language code ("en" or "nl")
         """
         self.language = language if language in self.TRANSLATIONS else "en"
+        self._translations = self.TRANSLATIONS[self.language]
 
     def get(self, key: str, default: str = None) -> str:
         """
@@ -170,7 +174,7 @@ class Language:
         Returns:
             Translated string
         """
-        return self.TRANSLATIONS[self.language].get(key, default or key)
+        return self._translations.get(key, default or key)
 
     def set_language(self, language: str):
         """
@@ -181,6 +185,7 @@ class Language:
         """
         if language in self.TRANSLATIONS:
             self.language = language
+            self._translations = self.TRANSLATIONS[language]
 
     def get_available_languages(self) -> Dict[str, str]:
         """